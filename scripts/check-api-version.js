@@ -17,6 +17,7 @@
 
 import fs from 'fs';
 import path from 'path';
+import crypto from 'crypto';
 import yaml from 'js-yaml';
 
 const specPath = path.resolve('docs/api-spec.yaml');
@@ -77,20 +78,31 @@ function detectBreakingChanges(oldVersion, newVersion) {
 
 /**
  * Read API spec version from YAML
+ *
+ * The version cache records the SHA-256 of the spec it was read from; when the
+ * spec bytes are unchanged the cached version is reused and the full YAML parse
+ * is skipped.
  */
-function readApiSpecVersion() {
+function readApiSpecVersion(cache = null) {
   if (!fs.existsSync(specPath)) {
     throw new Error(`API spec not found: ${specPath}`);
   }
 
-  const specContent = fs.readFileSync(specPath, 'utf-8');
-  const spec = yaml.load(specContent);
+  // Hash the raw bytes; the text decode is only paid for when we must parse
+  const specBytes = fs.readFileSync(specPath);
+  const specHash = crypto.createHash('sha256').update(specBytes).digest('hex');
+
+  if (cache && cache.specHash === specHash && cache.version) {
+    return { version: cache.version, specHash };
+  }
+
+  const spec = yaml.load(specBytes.toString('utf-8'));
 
   if (!spec.info || !spec.info.version) {
     throw new Error('API spec is missing info.version field');
   }
 
-  return spec.info.version;
+  return { version: spec.info.version, specHash };
 }
 
 /**
@@ -111,15 +123,28 @@ function loadVersionCache() {
 
 /**
  * Save current version to cache
+ *
+ * Written to a sibling temp file and renamed into place, so an interrupted run
+ * cannot leave a truncated cache that the next run would discard and treat as
+ * first-time setup (skipping the breaking-change comparison).
  */
-function saveVersionCache(version) {
+function saveVersionCache(version, specHash) {
+  const now = new Date().toISOString();
   const cache = {
     version,
-    timestamp: new Date().toISOString(),
-    buildTimestamp: process.env.BUILD_TIMESTAMP || new Date().toISOString()
+    specHash,
+    timestamp: now,
+    buildTimestamp: process.env.BUILD_TIMESTAMP || now
   };
 
-  fs.writeFileSync(versionCachePath, JSON.stringify(cache, null, 2));
+  const tmpPath = `${versionCachePath}.${process.pid}.tmp`;
+  try {
+    fs.writeFileSync(tmpPath, JSON.stringify(cache, null, 2));
+    fs.renameSync(tmpPath, versionCachePath);
+  } catch (error) {
+    fs.rmSync(tmpPath, { force: true });
+    throw error;
+  }
 }
 
 /**
@@ -127,16 +152,16 @@ function saveVersionCache(version) {
  */
 function checkApiVersion() {
   try {
-    const currentVersion = readApiSpecVersion();
-    const currentParsed = parseVersion(currentVersion);
     const cache = loadVersionCache();
+    const { version: currentVersion, specHash } = readApiSpecVersion(cache);
+    const currentParsed = parseVersion(currentVersion);
 
     console.log(`\n📋 API Version Check`);
     console.log(`Current API spec version: ${currentVersion}`);
 
     if (!cache) {
       console.log(`✅ First time setup - no previous version to compare`);
-      saveVersionCache(currentVersion);
+      saveVersionCache(currentVersion, specHash);
       return 0;
     }
 
@@ -170,7 +195,7 @@ function checkApiVersion() {
       console.log(`✅ API version unchanged`);
     }
 
-    saveVersionCache(currentVersion);
+    saveVersionCache(currentVersion, specHash);
     return 0;
   } catch (error) {
     console.error(`\n❌ Version check failed: ${error.message}`);
@@ -183,8 +208,8 @@ function checkApiVersion() {
 if (process.argv.includes('--force')) {
   console.log(`⏭️  Forcing version cache update...`);
   try {
-    const currentVersion = readApiSpecVersion();
-    saveVersionCache(currentVersion);
+    const { version: currentVersion, specHash } = readApiSpecVersion();
+    saveVersionCache(currentVersion, specHash);
     console.log(`✅ Version cache updated to ${currentVersion}`);
   } catch (error) {
     console.error(`Failed to update version cache: ${error.message}`);
@@ -16,21 +16,102 @@
 
 import fs from 'fs';
 import path from 'path';
+import crypto from 'crypto';
+import { fileURLToPath } from 'url';
 import yaml from 'js-yaml';
 
-const specPath = path.resolve('docs/api-spec.yaml');
+// Repo-relative, so the generated header does not depend on the checkout location
+const specRelativePath = 'docs/api-spec.yaml';
+const specPath = path.resolve(specRelativePath);
 const clientPath = path.resolve('src/core/services/generatedApiClient.ts');
+const scriptPath = fileURLToPath(import.meta.url);
+
+// Header line recording the inputs the client was generated from
+const SOURCE_HASH_LABEL = ' * Source hash: ';
+// The stamp sits in the first few header lines; no need to read the whole client
+const HEADER_PROBE_BYTES = 1024;
+
+// Matches a path template segment in either {paramName} or :paramName form
+const PATH_PARAM_RE = /\{(\w+)\}|:(\w+)/g;
+
+// Path-item keys that are operations (others are parameters, summary, servers...)
+const HTTP_METHODS = new Set(['get', 'post', 'put', 'patch', 'delete']);
 
 /**
- * Parse OpenAPI spec
+ * Write a file only when its content differs from what is on disk. The new
+ * content goes to a sibling temp file that is renamed into place, so an
+ * interrupted run never leaves a truncated client behind.
+ * @returns true if the file was (re)written
  */
-function parseOpenApiSpec() {
+function writeFileIfChanged(filePath, content) {
+  if (fs.existsSync(filePath) && fs.readFileSync(filePath, 'utf-8') === content) {
+    return false;
+  }
+
+  const tmpPath = `${filePath}.${process.pid}.tmp`;
+  try {
+    fs.writeFileSync(tmpPath, content);
+    fs.renameSync(tmpPath, filePath);
+  } catch (error) {
+    fs.rmSync(tmpPath, { force: true });
+    throw error;
+  }
+  return true;
+}
+
+/**
+ * Read the raw OpenAPI spec bytes
+ */
+function readSpecBytes() {
   if (!fs.existsSync(specPath)) {
     throw new Error(`OpenAPI spec not found: ${specPath}`);
   }
 
-  const specContent = fs.readFileSync(specPath, 'utf-8');
-  return yaml.load(specContent);
+  return fs.readFileSync(specPath);
+}
+
+/**
+ * Parse OpenAPI spec
+ */
+function parseOpenApiSpec(specBytes) {
+  return yaml.load(specBytes.toString('utf-8'));
+}
+
+/**
+ * The generated client is a pure function of the spec and this script, so a
+ * hash of both identifies its content without generating it
+ */
+function computeSourceHash(specBytes) {
+  return crypto
+    .createHash('sha256')
+    .update(specBytes)
+    .update(fs.readFileSync(scriptPath))
+    .digest('hex');
+}
+
+/**
+ * Read the source hash stamped into an existing client's header
+ * @returns the hash, or null if the file is missing or unstamped
+ */
+function readStampedSourceHash(filePath) {
+  let fd;
+  try {
+    fd = fs.openSync(filePath, 'r');
+  } catch {
+    return null;
+  }
+
+  try {
+    const buffer = Buffer.alloc(HEADER_PROBE_BYTES);
+    const bytesRead = fs.readSync(fd, buffer, 0, HEADER_PROBE_BYTES, 0);
+    const header = buffer.toString('utf-8', 0, bytesRead);
+    const start = header.indexOf(SOURCE_HASH_LABEL);
+    if (start === -1) return null;
+    const end = header.indexOf('\n', start);
+    return end === -1 ? null : header.slice(start + SOURCE_HASH_LABEL.length, end).trim();
+  } finally {
+    fs.closeSync(fd);
+  }
 }
 
 /**
@@ -45,16 +126,21 @@ function extractEndpoints(spec) {
   }
 
   for (const [pathStr, pathItem] of Object.entries(spec.paths)) {
-    for (const [method, operation] of Object.entries(pathItem)) {
-      if (['get', 'post', 'put', 'patch', 'delete'].includes(method.toLowerCase())) {
+    for (const [key, operation] of Object.entries(pathItem)) {
+      const method = key.toLowerCase();
+      if (HTTP_METHODS.has(method)) {
         const operationId = operation.operationId || `${method}${pathStr.replace(/[^a-zA-Z0-9]/g, '')}`;
+        const parameters = operation.parameters || [];
         endpoints.push({
           path: pathStr,
-          method: method.toLowerCase(),
+          method,
           operationId,
           summary: operation.summary || '',
           description: operation.description || '',
-          parameters: operation.parameters || [],
+          parameters,
+          // Split once here; the fetch method and hook generators both need these
+          pathParams: parameters.filter(p => p.in === 'path'),
+          queryParams: parameters.filter(p => p.in === 'query'),
           requestBody: operation.requestBody,
           responses: operation.responses || {},
           security: operation.security
@@ -76,14 +162,12 @@ function generateFetchMethod(endpoint) {
   const params = [];
 
   // Add path parameters
-  endpoint.parameters
-    .filter(p => p.in === 'path')
-    .forEach(p => {
-      params.push(`${p.name}: string`);
-    });
+  endpoint.pathParams.forEach(p => {
+    params.push(`${p.name}: string`);
+  });
 
   // Add query parameters
-  const queryParams = endpoint.parameters.filter(p => p.in === 'query');
+  const { queryParams } = endpoint;
   if (queryParams.length > 0) {
     params.push(`query?: { ${queryParams.map(p => `${p.name}?: string`).join(', ')} }`);
   }
@@ -96,15 +180,14 @@ function generateFetchMethod(endpoint) {
   funcSignature += params.join(', ') + '): Promise<unknown>';
 
   // Build request URL - remove quotes, properly interpolate
-  // URL-encode path parameters to handle special characters
-  let urlBuilder = path;
-  endpoint.parameters
-    .filter(p => p.in === 'path')
-    .forEach(p => {
-      // Handle both {paramName} (OpenAPI 3.0 standard) and :paramName (custom) syntax
-      urlBuilder = urlBuilder.replace(`{${p.name}}`, `\${encodeURIComponent(${p.name})}`);
-      urlBuilder = urlBuilder.replace(`:${p.name}`, `\${encodeURIComponent(${p.name})}`);
-    });
+  // URL-encode path parameters to handle special characters. Both {paramName}
+  // (OpenAPI 3.0 standard) and :paramName (custom) syntax are rewritten in a
+  // single scan of the path rather than two replace() passes per parameter.
+  const pathParamNames = new Set(endpoint.pathParams.map(p => p.name));
+  const urlBuilder = path.replace(PATH_PARAM_RE, (match, braced, colon) => {
+    const name = braced ?? colon;
+    return pathParamNames.has(name) ? `\${encodeURIComponent(${name})}` : match;
+  });
 
   // Build query string
   let queryCode = '';
@@ -161,44 +244,45 @@ function generateFetchMethod(endpoint) {
   return methodCode;
 }
 
+// Query keys that mutations invalidate, as emitted into the generated hooks
+const ANNOTATIONS_LIST_KEY = `{ queryKey: ['getapiannotations'] }`;
+const ANNOTATION_KEY = `{ queryKey: ['getapiannotationsannotationId', annotationId] }`;
+const ANNOTATION_REPLIES_KEY = `{ queryKey: ['getapiannotationsannotationIdreplies', annotationId] }`;
+
+/**
+ * Mutation → invalidation mapping, checked in order; the first rule whose
+ * pattern occurs in the operation ID (and whose exclusion does not) wins
+ */
+const INVALIDATION_RULES = [
+  // POST /api/annotations → invalidate getapiannotations list
+  { patterns: ['postapiannotations'], unless: 'replies', queries: [ANNOTATIONS_LIST_KEY] },
+  // PUT/PATCH/DELETE /api/annotations/:annotationId → invalidate both the specific annotation and the list
+  {
+    patterns: ['putapiannotationsannotationId', 'patchapiannotationsannotationId', 'deleteapiannotationsannotationId'],
+    queries: [ANNOTATION_KEY, ANNOTATIONS_LIST_KEY]
+  },
+  // POST /api/annotations/:annotationId/replies → invalidate replies for this annotation
+  { patterns: ['postapiannotationsannotationIdreplies'], queries: [ANNOTATION_REPLIES_KEY] }
+];
+
 /**
  * Determine which query keys should be invalidated for a mutation
  * @param operationId The operation ID (e.g., 'postapiannotations')
- * @param pathParams Path parameters
  * @returns Array of invalidation code snippets
  */
-function getInvalidationQueries(operationId, pathParams) {
-  // Map operation IDs to their related query keys
-  // This handles the relationship between mutations and queries
-
-  const invalidations = [];
-
-  // Handle annotation-related operations
-  if (operationId.includes('annotation')) {
-    if (operationId.includes('postapiannotations') && !operationId.includes('replies')) {
-      // POST /api/annotations → invalidate getapiannotations list
-      invalidations.push(`{ queryKey: ['getapiannotations'] }`);
-    } else if (operationId.includes('putapiannotationsannotationId') ||
-               operationId.includes('patchapiannotationsannotationId')) {
-      // PUT/PATCH /api/annotations/:annotationId → invalidate both the specific annotation and the list
-      invalidations.push(`{ queryKey: ['getapiannotationsannotationId', annotationId] }`);
-      invalidations.push(`{ queryKey: ['getapiannotations'] }`);
-    } else if (operationId.includes('deleteapiannotationsannotationId')) {
-      // DELETE /api/annotations/:annotationId → invalidate both the specific annotation and the list
-      invalidations.push(`{ queryKey: ['getapiannotationsannotationId', annotationId] }`);
-      invalidations.push(`{ queryKey: ['getapiannotations'] }`);
-    } else if (operationId.includes('postapiannotationsannotationIdreplies')) {
-      // POST /api/annotations/:annotationId/replies → invalidate replies for this annotation
-      invalidations.push(`{ queryKey: ['getapiannotationsannotationIdreplies', annotationId] }`);
-    }
-  }
+function getInvalidationQueries(operationId) {
+  const rule = INVALIDATION_RULES.find(({ patterns, unless }) =>
+    patterns.some(pattern => operationId.includes(pattern)) &&
+    !(unless && operationId.includes(unless))
+  );
 
   // If no specific invalidations found, emit a build-time warning
-  if (invalidations.length === 0) {
-    console.warn(`⚠️  No invalidation mapping found for operation: ${operationId}. Add explicit mapping to getInvalidationQueries().`);
+  if (!rule) {
+    console.warn(`⚠️  No invalidation mapping found for operation: ${operationId}. Add explicit mapping to INVALIDATION_RULES.`);
+    return [];
   }
 
-  return invalidations;
+  return rule.queries;
 }
 
 /**
@@ -209,7 +293,7 @@ function generateReactQueryHook(endpoint) {
   const hookName = `use${operationId.charAt(0).toUpperCase() + operationId.slice(1)}`;
 
   // Extract path parameters for hook signature
-  const pathParams = endpoint.parameters.filter(p => p.in === 'path');
+  const { pathParams } = endpoint;
   const pathParamStr = pathParams.length > 0
     ? pathParams.map(p => `${p.name}: string`).join(', ')
     : '';
@@ -237,10 +321,10 @@ function generateReactQueryHook(endpoint) {
     const paramStr = pathParamStr ? `${pathParamStr}, options?: MutationOptions` : 'options?: MutationOptions';
 
     // Get the correct invalidation queries
-    const invalidationQueries = getInvalidationQueries(operationId, pathParams);
+    const invalidationQueries = getInvalidationQueries(operationId);
     const invalidationCode = invalidationQueries.length > 0
       ? invalidationQueries.map(q => `        queryClient.invalidateQueries(${q});`).join('\n')
-      : `        console.warn('[WARNING] Unmapped cache invalidation for ${operationId}. Add to getInvalidationQueries().');
+      : `        console.warn('[WARNING] Unmapped cache invalidation for ${operationId}. Add to INVALIDATION_RULES.');
         queryClient.invalidateQueries({ queryKey: ['${operationId}'] });`;
 
     if (hasBody) {
@@ -280,23 +364,9 @@ ${invalidationCode}
   }
 }
 
-/**
- * Generate complete API client code
- */
-function generateApiClient(spec, endpoints) {
-  const fetchMethods = endpoints.map(ep => generateFetchMethod(ep)).join('\n');
-  const reactQueryHooks = endpoints.map(ep => generateReactQueryHook(ep)).join('\n');
-
-  const code = `/**
- * Auto-generated API Client with React Query Hooks
- * Generated from: ${specPath}
- * API Version: ${spec.info?.version || 'unknown'}
- *
- * IMPORTANT: This file is auto-generated. Do not edit directly.
- * Regenerate with: npm run client:generate
- */
-
-import { useQuery, useMutation, useQueryClient, UseQueryOptions, UseMutationOptions, QueryClient } from '@tanstack/react-query';
+// Static sections of the generated client, built once at module load. Only
+// the header, fetch methods and hooks vary with the spec.
+const CLIENT_CLASS_PRELUDE = `import { useQuery, useMutation, useQueryClient, UseQueryOptions, UseMutationOptions, QueryClient } from '@tanstack/react-query';
 
 /**
  * Type definitions for query/mutation options
@@ -355,8 +425,9 @@ export class ApiClient {
   }
 
   // Generated fetch methods
-${fetchMethods}
-}
+`;
+
+const CLIENT_SINGLETON_SECTION = `}
 
 /**
  * Singleton instance of API client
@@ -387,8 +458,9 @@ export function setApiToken(token: string | null): void {
 const apiClient = getApiClient();
 
 // React Query Hooks
-${reactQueryHooks}
+`;
 
+const CLIENT_QUERY_CLIENT_SECTION = `
 /**
  * Create a QueryClient with recommended defaults for DR API
  */
@@ -407,7 +479,27 @@ export function createApiQueryClient(): QueryClient {
   });
 }`;
 
-  return code;
+/**
+ * Generate complete API client code
+ */
+function generateApiClient(spec, endpoints, sourceHash) {
+  const fetchMethods = endpoints.map(ep => generateFetchMethod(ep)).join('\n');
+  const reactQueryHooks = endpoints.map(ep => generateReactQueryHook(ep)).join('\n');
+
+  const header = `/**
+ * Auto-generated API Client with React Query Hooks
+ * Generated from: ${specRelativePath}
+ * API Version: ${spec.info?.version || 'unknown'}
+${SOURCE_HASH_LABEL}${sourceHash}
+ *
+ * IMPORTANT: This file is auto-generated. Do not edit directly.
+ * Regenerate with: npm run client:generate
+ */
+
+`;
+
+  return header + CLIENT_CLASS_PRELUDE + fetchMethods + '\n' +
+    CLIENT_SINGLETON_SECTION + reactQueryHooks + '\n' + CLIENT_QUERY_CLIENT_SECTION;
 }
 
 /**
@@ -418,13 +510,23 @@ function generateClient() {
     console.log(`\n🔧 Generating API Client with React Query Hooks`);
     console.log(`Reading OpenAPI spec from: ${specPath}`);
 
-    const spec = parseOpenApiSpec();
+    const specBytes = readSpecBytes();
+    const sourceHash = computeSourceHash(specBytes);
+
+    // Neither the spec nor the generator changed since the client was written:
+    // skip parsing and generation entirely (pass --force to regenerate anyway)
+    if (!process.argv.includes('--force') && readStampedSourceHash(clientPath) === sourceHash) {
+      console.log(`✅ API client up to date (source hash unchanged): ${clientPath}\n`);
+      return 0;
+    }
+
+    const spec = parseOpenApiSpec(specBytes);
     console.log(`✅ Parsed API spec: ${spec.info?.title} v${spec.info?.version}`);
 
     const endpoints = extractEndpoints(spec);
     console.log(`✅ Found ${endpoints.length} endpoints`);
 
-    const clientCode = generateApiClient(spec, endpoints);
+    const clientCode = generateApiClient(spec, endpoints, sourceHash);
 
     // Ensure directory exists
     const clientDir = path.dirname(clientPath);
@@ -432,8 +534,11 @@ function generateClient() {
       fs.mkdirSync(clientDir, { recursive: true });
     }
 
-    fs.writeFileSync(clientPath, clientCode);
-    console.log(`✅ Generated API client: ${clientPath}`);
+    if (writeFileIfChanged(clientPath, clientCode)) {
+      console.log(`✅ Generated API client: ${clientPath}`);
+    } else {
+      console.log(`✅ API client unchanged: ${clientPath}`);
+    }
 
     // Print generated endpoints summary
     console.log(`\n📋 Generated ${endpoints.length} endpoint methods:`);
@@ -29,24 +29,31 @@ const colors = {
   yellow: '\x1b[33m',
 };
 
-function log(message, color = colors.reset) {
-  console.log(`${color}${message}${colors.reset}`);
-}
-
 /**
- * Calculate SHA256 hash of a file
+ * Build timestamp for the manifest. Honors SOURCE_DATE_EPOCH (the
+ * reproducible-builds convention) so identical inputs yield an identical
+ * manifest; falls back to the current time.
  */
-function getFileHash(filePath) {
-  const content = fs.readFileSync(filePath);
-  return crypto.createHash('sha256').update(content).digest('hex');
+function getBuildDate() {
+  const epoch = process.env.SOURCE_DATE_EPOCH;
+  return epoch && /^\d+$/.test(epoch)
+    ? new Date(Number(epoch) * 1000).toISOString()
+    : new Date().toISOString();
+}
+
+function log(message, color = colors.reset) {
+  console.log(`${color}${message}${colors.reset}`);
 }
 
 /**
- * Get file size in bytes
+ * Calculate SHA256 hash and size in bytes of a file from a single read
  */
-function getFileSize(filePath) {
-  const stats = fs.statSync(filePath);
-  return stats.size;
+async function getFileDigest(filePath) {
+  const content = await fs.promises.readFile(filePath);
+  return {
+    hash: crypto.createHash('sha256').update(content).digest('hex'),
+    size: content.length
+  };
 }
 
 /**
@@ -82,10 +89,26 @@ function copyDirectory(src, dest) {
   }
 }
 
+/**
+ * List files under a bundle directory recursively, as bundle-relative POSIX
+ * paths. Uses the dirent type returned by readdir rather than a stat per entry.
+ */
+function listFiles(dir, files = []) {
+  for (const entry of fs.readdirSync(dir, { withFileTypes: true })) {
+    const abs = path.join(dir, entry.name);
+    if (entry.isDirectory()) {
+      listFiles(abs, files);
+    } else if (entry.isFile()) {
+      files.push(path.relative(BUNDLE_DIR, abs).split(path.sep).join('/'));
+    }
+  }
+  return files;
+}
+
 /**
  * Main packaging function
  */
-function packageEmbedded() {
+async function packageEmbedded() {
   log('\n' + '='.repeat(60), colors.bright);
   log('Packaging Embedded Viewer for Python Distribution', colors.bright);
   log('='.repeat(60) + '\n', colors.bright);
@@ -153,7 +176,7 @@ function packageEmbedded() {
 
   // Generate manifest
   log('4. Generating manifest...', colors.blue);
-  const manifest = generateManifest();
+  const manifest = await generateManifest();
   fs.writeFileSync(
     path.join(BUNDLE_DIR, 'manifest.json'),
     JSON.stringify(manifest, null, 2)
@@ -178,82 +201,60 @@ function packageEmbedded() {
 /**
  * Generate manifest.json
  */
-function generateManifest() {
+async function generateManifest() {
   const manifest = {
     name: 'documentation-robotics-viewer-embedded',
     version: require('../package.json').version,
-    buildDate: new Date().toISOString(),
+    buildDate: getBuildDate(),
     entryPoint: 'index.html',
     files: [],
     totalSize: 0
   };
 
-  // Scan assets directory
-  const assetFiles = fs.readdirSync(path.join(BUNDLE_DIR, 'assets'));
-
-  for (const file of assetFiles) {
-    const filePath = path.join(BUNDLE_DIR, 'assets', file);
-    const hash = getFileHash(filePath);
-    const size = getFileSize(filePath);
+  // Collect every bundled file first; hashing is then done concurrently below
+  // instead of one blocking read after another.
+  const entries = [];
 
-    manifest.files.push({
-      path: `assets/${file}`,
-      hash: hash.substring(0, 16), // Short hash
-      size: size,
+  // Scan assets directory
+  for (const file of listFiles(path.join(BUNDLE_DIR, 'assets'))) {
+    entries.push({
+      path: file,
       type: file.endsWith('.js') ? 'javascript' :
             file.endsWith('.css') ? 'stylesheet' : 'other'
     });
-
-    manifest.totalSize += size;
   }
 
   // Add HTML file
-  const htmlPath = path.join(BUNDLE_DIR, 'index.html');
-  manifest.files.push({
-    path: 'index.html',
-    hash: getFileHash(htmlPath).substring(0, 16),
-    size: getFileSize(htmlPath),
-    type: 'html'
-  });
-  manifest.totalSize += getFileSize(htmlPath);
+  entries.push({ path: 'index.html', type: 'html' });
 
   // Add the favicon if present.
-  const faviconPath = path.join(BUNDLE_DIR, 'favicon.svg');
-  if (fs.existsSync(faviconPath)) {
-    manifest.files.push({
-      path: 'favicon.svg',
-      hash: getFileHash(faviconPath).substring(0, 16),
-      size: getFileSize(faviconPath),
-      type: 'image'
-    });
-    manifest.totalSize += getFileSize(faviconPath);
+  if (fs.existsSync(path.join(BUNDLE_DIR, 'favicon.svg'))) {
+    entries.push({ path: 'favicon.svg', type: 'image' });
   }
 
   // Add self-hosted font files (recursive: fonts/{inter,jetbrains-mono}/*.woff2).
   const fontsRoot = path.join(BUNDLE_DIR, 'fonts');
   if (fs.existsSync(fontsRoot)) {
-    const walk = (dir) => {
-      for (const entry of fs.readdirSync(dir, { withFileTypes: true })) {
-        const abs = path.join(dir, entry.name);
-        if (entry.isDirectory()) {
-          walk(abs);
-        } else {
-          const rel = path.relative(BUNDLE_DIR, abs).split(path.sep).join('/');
-          const size = getFileSize(abs);
-          manifest.files.push({
-            path: rel,
-            hash: getFileHash(abs).substring(0, 16),
-            size,
-            type: abs.endsWith('.woff2') ? 'font' :
-                  abs.endsWith('.css') ? 'stylesheet' : 'other'
-          });
-          manifest.totalSize += size;
-        }
-      }
-    };
-    walk(fontsRoot);
+    for (const file of listFiles(fontsRoot)) {
+      entries.push({
+        path: file,
+        type: file.endsWith('.woff2') ? 'font' :
+              file.endsWith('.css') ? 'stylesheet' : 'other'
+      });
+    }
   }
 
+  manifest.files = await Promise.all(entries.map(async (entry) => {
+    const { hash, size } = await getFileDigest(path.join(BUNDLE_DIR, entry.path));
+    return {
+      path: entry.path,
+      hash: hash.substring(0, 16), // Short hash
+      size,
+      type: entry.type
+    };
+  }));
+  manifest.totalSize = manifest.files.reduce((total, file) => total + file.size, 0);
+
   // Sort files by size (largest first)
   manifest.files.sort((a, b) => b.size - a.size);
 
@@ -395,4 +396,7 @@ For issues or questions about the embedded viewer:
 }
 
 // Run packaging
-packageEmbedded();
+packageEmbedded().catch((error) => {
+  log(`Error: packaging failed: ${error.message}`, colors.yellow);
+  process.exit(1);
+});
@@ -64,14 +64,30 @@ const OP_META: Record<ChangeOp, OpMeta> = {
   },
 };
 
+/** Whole-word op aliases, matched before the substring rules. */
+const OP_ALIASES: ReadonlyMap<string, ChangeOp> = new Map<string, ChangeOp>([
+  ['del', 'delete'],
+  ['remove', 'delete'],
+  ['create', 'add'],
+]);
+
+/** Substring rules in priority order (`delete` wins over `add`). */
+const OP_SUBSTRINGS: ReadonlyArray<readonly [string, ChangeOp]> = [
+  ['delete', 'delete'],
+  ['add', 'add'],
+];
+
 /**
  * Normalize a raw change `type` to one of the three op buckets.
  * `relationship-add` → add, `relationship-delete` → delete, etc.
  */
 export function normalizeOp(type: string | undefined): ChangeOp {
   const t = (type ?? '').toLowerCase();
-  if (t.includes('delete') || t === 'del' || t === 'remove') return 'delete';
-  if (t.includes('add') || t === 'create') return 'add';
+  const alias = OP_ALIASES.get(t);
+  if (alias) return alias;
+  for (const [needle, op] of OP_SUBSTRINGS) {
+    if (t.includes(needle)) return op;
+  }
   return 'update';
 }
 
@@ -137,14 +153,15 @@ function changedFields(
  *   - delete → 'Removed {type}'
  *   - update → 'Changed {field, field}' (or 'Updated {type}' when nothing diffs)
  */
-export function changeDetail(change: ChangeRecord): string {
-  const op = normalizeOp(change.type);
-  if (op === 'add') {
-    const isRel = (change.type ?? '').includes('relationship');
-    return isRel ? 'Added relationship' : `Added ${elementTypeOf(change.after)}`;
-  }
-  if (op === 'delete') {
+export function changeDetail(
+  change: ChangeRecord,
+  op: ChangeOp = normalizeOp(change.type),
+): string {
+  if (op !== 'update') {
     const isRel = (change.type ?? '').includes('relationship');
+    if (op === 'add') {
+      return isRel ? 'Added relationship' : `Added ${elementTypeOf(change.after)}`;
+    }
     return isRel ? 'Removed relationship' : `Removed ${elementTypeOf(change.before)}`;
   }
   const fields = changedFields(change.before, change.after);
@@ -164,7 +181,7 @@ export function toChangeRow(change: ChangeRecord, idx: number): ChangeRow {
     meta: OP_META[op],
     elementId,
     layerName: change.layerName ?? '',
-    detail: changeDetail(change),
+    detail: changeDetail(change, op),
     hasDiff: Boolean(change.before) || Boolean(change.after),
     raw: change,
   };
@@ -19,6 +19,14 @@ import type {
 } from '@tinkermonkey/heimdall-ui';
 import type { ModelDerived, ModelNode, ModelLink } from './useModel';
 
+/**
+ * Memo of name -> slug. Element names repeat across every model refresh (each
+ * WS `model.updated` rebuilds the index), so the four regex passes run once per
+ * distinct name. Cleared wholesale at the cap so it can't grow without bound.
+ */
+const SLUG_CACHE_LIMIT = 10_000;
+const slugCache = new Map<string, string>();
+
 /**
  * Slugify an element name to match the model's canonical dotted-id segment.
  *
@@ -29,12 +37,17 @@ import type { ModelDerived, ModelNode, ModelLink } from './useModel';
  *  - lowercase, collapse any other non-alphanumeric run to a single hyphen, trim
  */
 export function slugifyName(name: string): string {
-  return name
+  const cached = slugCache.get(name);
+  if (cached !== undefined) return cached;
+  const slug = name
     .replace(/([a-z])([A-Z])/g, '$1-$2')
     .replace(/\./g, '')
     .toLowerCase()
     .replace(/[^a-z0-9]+/g, '-')
     .replace(/^-+|-+$/g, '');
+  if (slugCache.size >= SLUG_CACHE_LIMIT) slugCache.clear();
+  slugCache.set(name, slug);
+  return slug;
 }
 
 /** Canonical dotted id for a node: `{layer_id}.{type}.{slug(name)}`. */
@@ -53,7 +66,13 @@ export interface ModelIndex {
   byUuid: Map<string, ModelNode>;
 }
 
+// Canvas, Inspector and ChatPanel each ask for the index of the same derived
+// model; keyed by identity so the dotted-id pass runs once per payload.
+const indexCache = new WeakMap<ModelDerived, ModelIndex>();
+
 export function buildModelIndex(model: ModelDerived): ModelIndex {
+  const cached = indexCache.get(model);
+  if (cached) return cached;
   const byEndpoint = new Map<string, ModelNode>();
   const byUuid = new Map<string, ModelNode>();
   for (const node of model.nodes) {
@@ -61,7 +80,9 @@ export function buildModelIndex(model: ModelDerived): ModelIndex {
     byEndpoint.set(node.id, node);
     byEndpoint.set(dottedId(node), node);
   }
-  return { byEndpoint, byUuid };
+  const index = { byEndpoint, byUuid };
+  indexCache.set(model, index);
+  return index;
 }
 
 /** Resolve a link endpoint (UUID or dotted id) to its node, or undefined. */
@@ -53,6 +53,31 @@ const EMPTY_DERIVED: ModelDerived = {
   relCount: 0,
 };
 
+// Derived results keyed by payload identity, shared by every `useModel()`
+// consumer. A refetch or WS-driven invalidation yields a new payload object,
+// so a changed model is re-derived and an unchanged one is a single lookup.
+const derivedCache = new WeakMap<ModelPayload, ModelDerived>();
+
+function deriveModel(raw: ModelPayload): ModelDerived {
+  const countsByLayer: Record<string, number> = {};
+  const nodesByLayer: Record<string, ModelNode[]> = {};
+
+  for (const node of raw.nodes) {
+    const layer = node.layer_id;
+    if (!layer) continue;
+    countsByLayer[layer] = (countsByLayer[layer] ?? 0) + 1;
+    (nodesByLayer[layer] ??= []).push(node);
+  }
+
+  return {
+    nodes: raw.nodes,
+    links: raw.links ?? [],
+    countsByLayer,
+    nodesByLayer,
+    relCount: raw.links?.length ?? 0,
+  };
+}
+
 export function useModel() {
   const query = useGetapimodel();
   const raw = query.data as ModelPayload | undefined;
@@ -60,23 +85,12 @@ export function useModel() {
   const derived = useMemo<ModelDerived>(() => {
     if (!raw?.nodes) return EMPTY_DERIVED;
 
-    const countsByLayer: Record<string, number> = {};
-    const nodesByLayer: Record<string, ModelNode[]> = {};
-
-    for (const node of raw.nodes) {
-      const layer = node.layer_id;
-      if (!layer) continue;
-      countsByLayer[layer] = (countsByLayer[layer] ?? 0) + 1;
-      (nodesByLayer[layer] ??= []).push(node);
+    let cached = derivedCache.get(raw);
+    if (!cached) {
+      cached = deriveModel(raw);
+      derivedCache.set(raw, cached);
     }
-
-    return {
-      nodes: raw.nodes,
-      links: raw.links ?? [],
-      countsByLayer,
-      nodesByLayer,
-      relCount: raw.links?.length ?? 0,
-    };
+    return cached;
   }, [raw]);
 
   return { ...query, derived };
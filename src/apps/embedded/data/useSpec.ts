@@ -61,6 +61,37 @@ export interface SpecDerived {
 
 const EMPTY_DERIVED: SpecDerived = { version: '', byLayer: {} };
 
+// Derived results keyed by payload identity. Every shell component calls
+// `useSpec()`, and they all receive the same React Query `data` object, so the
+// per-layer walk runs once per fetched payload rather than once per consumer.
+// A refetch yields a new object, which is what invalidates the entry.
+const derivedCache = new WeakMap<SpecPayload, SpecDerived>();
+
+function deriveSpec(raw: SpecPayload): SpecDerived {
+  const byLayer: Record<string, SpecLayerInfo> = {};
+
+  for (const value of Object.values(raw.schemas ?? {})) {
+    const entry = value as SpecSchemaEntry;
+    const layer = entry.layer;
+    if (!layer?.id) continue;
+    // CAUTION: `layer.node_types` can be empty even when node-types exist —
+    // derive the canonical list from `nodeSchemas` keys instead.
+    const nodeSchemas = entry.nodeSchemas ?? {};
+    const typeIds = Object.keys(nodeSchemas);
+    byLayer[layer.id] = {
+      typeCount: typeIds.length,
+      typeIds,
+      typeTitles: typeIds.map((id) => nodeSchemas[id]?.title ?? id),
+      standard: layer.inspired_by?.standard ?? layerStandard(layer.id),
+    };
+  }
+
+  return {
+    version: raw.version ?? '',
+    byLayer,
+  };
+}
+
 export function useSpec() {
   const query = useGetapispec();
   const raw = query.data as SpecPayload | undefined;
@@ -68,28 +99,12 @@ export function useSpec() {
   const derived = useMemo<SpecDerived>(() => {
     if (!raw?.schemas) return EMPTY_DERIVED;
 
-    const byLayer: Record<string, SpecLayerInfo> = {};
-
-    for (const value of Object.values(raw.schemas)) {
-      const entry = value as SpecSchemaEntry;
-      const layer = entry.layer;
-      if (!layer?.id) continue;
-      // CAUTION: `layer.node_types` can be empty even when node-types exist —
-      // derive the canonical list from `nodeSchemas` keys instead.
-      const nodeSchemas = entry.nodeSchemas ?? {};
-      const typeIds = Object.keys(nodeSchemas);
-      byLayer[layer.id] = {
-        typeCount: typeIds.length,
-        typeIds,
-        typeTitles: typeIds.map((id) => nodeSchemas[id]?.title ?? id),
-        standard: layer.inspired_by?.standard ?? layerStandard(layer.id),
-      };
+    let cached = derivedCache.get(raw);
+    if (!cached) {
+      cached = deriveSpec(raw);
+      derivedCache.set(raw, cached);
     }
-
-    return {
-      version: raw.version ?? '',
-      byLayer,
-    };
+    return cached;
   }, [raw]);
 
   return { ...query, derived, raw };
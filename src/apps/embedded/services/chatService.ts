@@ -47,6 +47,7 @@ function convertToolStatus(wireStatus: string, result?: unknown, error?: string)
 export class ChatService {
   private currentConversationId: string | null = null;
   private currentRequestId: string | null = null;
+  private pendingStatus: Promise<SDKStatus> | null = null;
 
   constructor() {
     this.setupNotificationHandlers();
@@ -71,30 +72,18 @@ export class ChatService {
    * They are triggered independently of the main `sendMessage()` promise resolution.
    */
   private setupNotificationHandlers(): void {
-    // Handle text response chunks
-    jsonRpcHandler.onNotification('chat.response.chunk', (params: any) => {
-      this.handleResponseChunk(params);
-    });
-
-    // Handle tool invocations
-    jsonRpcHandler.onNotification('chat.tool.invoke', (params: any) => {
-      this.handleToolInvoke(params);
-    });
-
-    // Handle thinking content
-    jsonRpcHandler.onNotification('chat.thinking', (params: any) => {
-      this.handleThinking(params);
-    });
-
-    // Handle usage information
-    jsonRpcHandler.onNotification('chat.usage', (params: any) => {
-      this.handleUsage(params);
-    });
-
-    // Handle errors
-    jsonRpcHandler.onNotification('chat.error', (params: any) => {
-      this.handleError(params);
-    });
+    // Method → handler dispatch table; registration order is the table order
+    const handlers: ReadonlyArray<readonly [string, (params: any) => void]> = [
+      ['chat.response.chunk', (params) => this.handleResponseChunk(params)],
+      ['chat.tool.invoke', (params) => this.handleToolInvoke(params)],
+      ['chat.thinking', (params) => this.handleThinking(params)],
+      ['chat.usage', (params) => this.handleUsage(params)],
+      ['chat.error', (params) => this.handleError(params)],
+    ];
+
+    for (const [method, handler] of handlers) {
+      jsonRpcHandler.onNotification(method, handler);
+    }
   }
 
   /**
@@ -111,9 +100,27 @@ export class ChatService {
    * Throws:
    * - Re-throws the error after logging and updating store state
    *
+   * Concurrent callers share the in-flight `chat.status` request instead of
+   * each issuing their own; the next call after it settles asks the server again.
+   *
    * Timeout: 60 seconds
    */
-  async getStatus(): Promise<SDKStatus> {
+  getStatus(): Promise<SDKStatus> {
+    if (!this.pendingStatus) {
+      const request: Promise<SDKStatus> = this.fetchStatus().finally(() => {
+        if (this.pendingStatus === request) {
+          this.pendingStatus = null;
+        }
+      });
+      this.pendingStatus = request;
+    }
+    return this.pendingStatus;
+  }
+
+  /**
+   * Issue the `chat.status` request and mirror the result into the store
+   */
+  private async fetchStatus(): Promise<SDKStatus> {
     try {
       const result = await jsonRpcHandler.sendRequest<any>(
         'chat.status',
@@ -190,6 +197,8 @@ export class ChatService {
     }
 
     const store = useChatStore.getState();
+    // One timestamp for the user message, its text part and the assistant placeholder
+    const timestamp = new Date().toISOString();
 
     // Create user message
     const userMessageId = this.generateMessageId();
@@ -197,12 +206,12 @@ export class ChatService {
       id: userMessageId,
       role: 'user',
       conversationId: this.currentConversationId || this.generateConversationId(),
-      timestamp: new Date().toISOString(),
+      timestamp,
       parts: [
         {
           type: 'text',
           content: message,
-          timestamp: new Date().toISOString(),
+          timestamp,
         } as TextContent,
       ],
     };
@@ -220,7 +229,7 @@ export class ChatService {
       id: assistantMessageId,
       role: 'assistant',
       conversationId: userMessage.conversationId,
-      timestamp: new Date().toISOString(),
+      timestamp,
       parts: [],
       isStreaming: true,
     };
@@ -568,6 +577,7 @@ export class ChatService {
   reset(): void {
     this.currentConversationId = null;
     this.currentRequestId = null;
+    this.pendingStatus = null;
     const store = useChatStore.getState();
     store.reset();
   }
@@ -11,6 +11,12 @@ import {
   SDKStatus,
 } from '../types/chat';
 
+// Built once at module load; the validators below run on every store write,
+// including each streamed chunk, so nothing here should be rebuilt per call.
+const ISO_TIMESTAMP_RE = /^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d{3})?Z?$/;
+const VALID_ROLES: readonly string[] = ['user', 'assistant', 'system'];
+const VALID_TOOL_STATES: readonly string[] = ['executing', 'completed', 'failed'];
+
 /**
  * Validation error that includes context about what failed
  */
@@ -42,11 +48,10 @@ export function validateMessageId(id: unknown): asserts id is string {
  * Validate message role
  */
 export function validateRole(role: unknown): asserts role is 'user' | 'assistant' | 'system' {
-  const validRoles = ['user', 'assistant', 'system'];
-  if (!validRoles.includes(role as string)) {
+  if (!VALID_ROLES.includes(role as string)) {
     throw new ChatValidationError(
       'INVALID_ROLE',
-      `Message role must be one of: ${validRoles.join(', ')}`,
+      `Message role must be one of: ${VALID_ROLES.join(', ')}`,
       { role }
     );
   }
@@ -65,8 +70,7 @@ export function validateTimestamp(timestamp: unknown): asserts timestamp is stri
   }
 
   // Basic ISO 8601 format check
-  const isoRegex = /^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d{3})?Z?$/;
-  if (!isoRegex.test(timestamp)) {
+  if (!ISO_TIMESTAMP_RE.test(timestamp)) {
     throw new ChatValidationError(
       'INVALID_TIMESTAMP_FORMAT',
       'Timestamp must be in ISO 8601 format (e.g., 2024-01-01T12:00:00.000Z)',
@@ -187,11 +191,10 @@ export function validateToolInvocationContent(content: unknown): asserts content
   }
 
   const status = tool.status as Record<string, unknown>;
-  const validStates = ['executing', 'completed', 'failed'];
-  if (!validStates.includes(status.state as string)) {
+  if (!VALID_TOOL_STATES.includes(status.state as string)) {
     throw new ChatValidationError(
       'INVALID_TOOL_STATUS_STATE',
-      `Tool status state must be one of: ${validStates.join(', ')}`,
+      `Tool status state must be one of: ${VALID_TOOL_STATES.join(', ')}`,
       { state: status.state }
     );
   }
@@ -384,11 +387,10 @@ export function validateChatMessage(message: unknown): asserts message is ChatMe
     );
   }
 
-  const validRoles = ['user', 'assistant', 'system'];
-  if (!validRoles.includes(chatMessage.role)) {
+  if (!VALID_ROLES.includes(chatMessage.role)) {
     throw new ChatValidationError(
       'INVALID_ROLE_VALUE',
-      `Role must be one of: ${validRoles.join(', ')}`,
+      `Role must be one of: ${VALID_ROLES.join(', ')}`,
       { role: chatMessage.role }
     );
   }
@@ -532,11 +534,10 @@ export function validateMessageUpdates(updates: unknown): asserts updates is Par
   }
 
   if (messageUpdates.role !== undefined) {
-    const validRoles = ['user', 'assistant', 'system'];
-    if (!validRoles.includes(messageUpdates.role as string)) {
+    if (!VALID_ROLES.includes(messageUpdates.role as string)) {
       throw new ChatValidationError(
         'INVALID_ROLE_UPDATE',
-        `Updated role must be one of: ${validRoles.join(', ')}`,
+        `Updated role must be one of: ${VALID_ROLES.join(', ')}`,
         { role: messageUpdates.role }
       );
     }
@@ -617,11 +618,10 @@ export function validateToolInvocationUpdates(updates: unknown): asserts updates
     }
 
     const status = toolUpdates.status as Record<string, unknown>;
-    const validStates = ['executing', 'completed', 'failed'];
-    if (!validStates.includes(status.state as string)) {
+    if (!VALID_TOOL_STATES.includes(status.state as string)) {
       throw new ChatValidationError(
         'INVALID_STATUS_STATE',
-        `Updated status state must be one of: ${validStates.join(', ')}`,
+        `Updated status state must be one of: ${VALID_TOOL_STATES.join(', ')}`,
         { state: status.state }
       );
     }
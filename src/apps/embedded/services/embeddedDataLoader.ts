@@ -15,15 +15,86 @@ import { ERROR_IDS } from '@/constants/errorIds';
 
 const API_BASE = '/api';
 
+/** DR CLI `layer_id` -> LayerType for the flat `{ nodes, links }` model format. */
+const LAYER_TYPE_MAP: Readonly<Record<string, LayerType>> = {
+  motivation: LayerType.Motivation,
+  business: LayerType.Business,
+  security: LayerType.Security,
+  application: LayerType.Application,
+  technology: LayerType.Technology,
+  api: LayerType.Api,
+  data_model: LayerType.DataModel,
+  datastore: LayerType.Datastore,
+  ux: LayerType.Ux,
+  navigation: LayerType.Navigation,
+  apm: LayerType.ApmObservability,
+  testing: LayerType.Application, // fallback
+};
+
+/**
+ * Shared default visuals. Every element that falls back to a default points at
+ * the same object instead of allocating its own nested position/size/style, so
+ * these must be treated as read-only — copy before modifying an element's visual.
+ */
+const GRAPH_NODE_VISUAL: ElementVisual = {
+  position: { x: 0, y: 0 },
+  size: { width: 200, height: 100 },
+  style: {}
+};
+
+const DEFAULT_VISUAL: ElementVisual = {
+  position: { x: 0, y: 0 },
+  size: { width: 200, height: 100 },
+  style: { backgroundColor: '#e3f2fd', borderColor: '#1976d2' }
+};
+
+/**
+ * Build a ModelElement from one node of the flat `{ nodes, links }` format.
+ * Kept out of normalizeModel so the per-node loop there stays a lookup + push.
+ */
+function graphNodeToElement(rawNode: Record<string, unknown>, nodeId: string, layerId: string): ModelElement {
+  let finalAttributes = (typeof rawNode.attributes === 'object' && rawNode.attributes !== null)
+    ? { ...(rawNode.attributes as Record<string, unknown>) }
+    : undefined;
+  // Include description in attributes if present at top level
+  if (typeof rawNode.description === 'string' && rawNode.description) {
+    if (!finalAttributes) {
+      finalAttributes = { description: rawNode.description };
+    } else if (!finalAttributes.description) {
+      finalAttributes.description = rawNode.description;
+    }
+  }
+  const specNodeId = typeof rawNode.spec_node_id === 'string' ? rawNode.spec_node_id : undefined;
+  return {
+    id: nodeId,
+    elementId: specNodeId,
+    specNodeId,
+    type: typeof rawNode.type === 'string' ? rawNode.type : '',
+    name: typeof rawNode.name === 'string' ? rawNode.name : '',
+    layerId,
+    attributes: finalAttributes,
+    properties: {},
+    sourceReference: (typeof rawNode.source_reference === 'object' && rawNode.source_reference !== null)
+      ? rawNode.source_reference as unknown as SourceReference
+      : undefined,
+    metadata: (typeof rawNode.metadata === 'object' && rawNode.metadata !== null)
+      ? rawNode.metadata as unknown as ElementMetadata
+      : undefined,
+    visual: GRAPH_NODE_VISUAL
+  };
+}
+
 const AUTH_STORAGE_KEY = 'dr_auth_token';
 const AUTH_COOKIE_NAME = 'dr_auth_token';
 
 function getCookieToken(): string | null {
   if (typeof document === 'undefined') return null;
-  const match = document.cookie.split(';').map(part => part.trim()).find(part => part.startsWith(`${AUTH_COOKIE_NAME}=`));
+  const prefix = `${AUTH_COOKIE_NAME}=`;
+  const match = document.cookie.split(';').map(part => part.trim()).find(part => part.startsWith(prefix));
   if (!match) return null;
   try {
-    return decodeURIComponent(match.split('=')[1] || '');
+    // Everything after the name; split('=') would truncate '='-padded tokens
+    return decodeURIComponent(match.slice(prefix.length));
   } catch (decodeError) {
     // Use structured error logging for consistent error tracking
     logError(
@@ -469,32 +540,18 @@ export class EmbeddedDataLoader {
 
     // Handle flat graph format from DR CLI: { nodes: [...], links: [...] }
     if (Array.isArray(modelData.nodes) && !Array.isArray(modelData.layers)) {
-      const LAYER_TYPE_MAP: Record<string, LayerType> = {
-        motivation: LayerType.Motivation,
-        business: LayerType.Business,
-        security: LayerType.Security,
-        application: LayerType.Application,
-        technology: LayerType.Technology,
-        api: LayerType.Api,
-        data_model: LayerType.DataModel,
-        datastore: LayerType.Datastore,
-        ux: LayerType.Ux,
-        navigation: LayerType.Navigation,
-        apm: LayerType.ApmObservability,
-        testing: LayerType.Application, // fallback
-      };
-
-      const defaultVisual: ElementVisual = {
-        position: { x: 0, y: 0 },
-        size: { width: 200, height: 100 },
-        style: {}
-      };
+      // Node→layer lookup, filled in the same pass, so we can resolve layer_id
+      // for links that lack it
+      const nodeLayerMap = new Map<string, string>();
 
       for (const rawNode of (modelData.nodes as Record<string, unknown>[])) {
+        const nodeId = typeof rawNode.id === 'string' ? rawNode.id : String(rawNode.id);
         const layerId = typeof rawNode.layer_id === 'string' ? rawNode.layer_id : 'unknown';
-        if (!normalized.layers[layerId]) {
+        nodeLayerMap.set(nodeId, layerId);
+        let layer = normalized.layers[layerId];
+        if (!layer) {
           const layerName = layerId.charAt(0).toUpperCase() + layerId.slice(1).replace(/_/g, ' ') + ' Layer';
-          normalized.layers[layerId] = {
+          layer = normalized.layers[layerId] = {
             id: layerId,
             type: LAYER_TYPE_MAP[layerId] ?? LayerType.Application,
             name: layerName,
@@ -502,42 +559,7 @@ export class EmbeddedDataLoader {
             relationships: []
           };
         }
-        let finalAttributes = (typeof rawNode.attributes === 'object' && rawNode.attributes !== null)
-          ? { ...(rawNode.attributes as Record<string, unknown>) }
-          : undefined;
-        // Include description in attributes if present at top level
-        if (typeof rawNode.description === 'string' && rawNode.description) {
-          if (!finalAttributes) {
-            finalAttributes = { description: rawNode.description };
-          } else if (!finalAttributes.description) {
-            finalAttributes.description = rawNode.description;
-          }
-        }
-        normalized.layers[layerId].elements.push({
-          id: typeof rawNode.id === 'string' ? rawNode.id : String(rawNode.id),
-          elementId: typeof rawNode.spec_node_id === 'string' ? rawNode.spec_node_id : undefined,
-          specNodeId: typeof rawNode.spec_node_id === 'string' ? rawNode.spec_node_id : undefined,
-          type: typeof rawNode.type === 'string' ? rawNode.type : '',
-          name: typeof rawNode.name === 'string' ? rawNode.name : '',
-          layerId,
-          attributes: finalAttributes,
-          properties: {},
-          sourceReference: (typeof rawNode.source_reference === 'object' && rawNode.source_reference !== null)
-            ? rawNode.source_reference as unknown as SourceReference
-            : undefined,
-          metadata: (typeof rawNode.metadata === 'object' && rawNode.metadata !== null)
-            ? rawNode.metadata as unknown as ElementMetadata
-            : undefined,
-          visual: defaultVisual
-        });
-      }
-
-      // Build a node→layer lookup so we can resolve layer_id for links that lack it
-      const nodeLayerMap = new Map<string, string>();
-      for (const rawNode of (modelData.nodes as Record<string, unknown>[])) {
-        const nodeId = typeof rawNode.id === 'string' ? rawNode.id : String(rawNode.id);
-        const layerId = typeof rawNode.layer_id === 'string' ? rawNode.layer_id : 'unknown';
-        nodeLayerMap.set(nodeId, layerId);
+        layer.elements.push(graphNodeToElement(rawNode, nodeId, layerId));
       }
 
       const rawLinks = Array.isArray(modelData.links) ? modelData.links as Record<string, unknown>[] : [];
@@ -698,13 +720,6 @@ export class EmbeddedDataLoader {
    * Normalize element visual properties with defaults
    */
   private normalizeVisual(visual: unknown): ElementVisual {
-    // Return default visual if input is invalid
-    const defaultVisual: ElementVisual = {
-      position: { x: 0, y: 0 },
-      size: { width: 200, height: 100 },
-      style: { backgroundColor: '#e3f2fd', borderColor: '#1976d2' }
-    };
-
     if (typeof visual !== 'object' || visual === null) {
       if (visual !== undefined) {
         logError(
@@ -717,13 +732,14 @@ export class EmbeddedDataLoader {
           }
         );
       }
-      return defaultVisual;
+      // Return default visual if input is invalid
+      return DEFAULT_VISUAL;
     }
 
     const visualObj = visual as Record<string, unknown>;
 
     // Ensure position is valid
-    let position = defaultVisual.position;
+    let position = DEFAULT_VISUAL.position;
     if (typeof visualObj.position === 'object' && visualObj.position !== null) {
       const pos = visualObj.position as Record<string, unknown>;
       if (typeof pos.x === 'number' && typeof pos.y === 'number') {
@@ -741,7 +757,7 @@ export class EmbeddedDataLoader {
     }
 
     // Ensure size is valid
-    let size = defaultVisual.size;
+    let size = DEFAULT_VISUAL.size;
     if (typeof visualObj.size === 'object' && visualObj.size !== null) {
       const sz = visualObj.size as Record<string, unknown>;
       if (typeof sz.width === 'number' && typeof sz.height === 'number') {
@@ -759,7 +775,7 @@ export class EmbeddedDataLoader {
     }
 
     // Ensure style is valid (at minimum an empty object)
-    let style = defaultVisual.style;
+    let style = DEFAULT_VISUAL.style;
     if (typeof visualObj.style === 'object' && visualObj.style !== null) {
       const st = visualObj.style as Record<string, unknown>;
       style = {
@@ -9,13 +9,14 @@ import {
   JsonRpcNotification,
   JsonRpcResponse,
   JsonRpcErrorResponse,
-  JsonRpcMessage,
   JsonRpcError,
 } from '../types/chat';
 import { logError, logWarning } from './errorTracker';
 import { ERROR_IDS } from '@/constants/errorIds';
 import type { WebSocketClientInterface } from './websocketClient';
 
+const JSONRPC_VERSION = '2.0';
+
 /**
  * Represents a pending JSON-RPC request awaiting a response
  */
@@ -106,47 +107,16 @@ export class JsonRpcHandler {
     try {
       const websocketClient = await this.getWebSocketClient();
 
-      websocketClient.on('message', (message: Record<string, unknown>) => {
-        try {
-          // Message is already parsed by websocketClient
-          // Type guard: validate message structure before casting
-          if (!this.isValidJsonRpcMessage(message)) {
-            logError(
-              ERROR_IDS.JSONRPC_MESSAGE_PARSE_FAILED,
-              'Invalid JSON-RPC message structure - missing required fields',
-              { message: String(message) }
-            );
-            return;
-          }
-          this.handleMessage(message);
-        } catch (error) {
-          // Distinguish between message structure errors and programming bugs
-          // Structure validation errors indicate invalid message properties (TypeError from null/undefined access)
-          const isStructureError = error instanceof TypeError;
-
-          if (isStructureError) {
-            // Invalid message structure - expected in some cases
-            logError(
-              ERROR_IDS.JSONRPC_MESSAGE_PARSE_FAILED,
-              'Invalid JSON-RPC message structure',
-              { error: error instanceof Error ? error.message : String(error), message: String(message) },
-              error instanceof Error ? error : new Error(String(error))
-            );
-          } else {
-            // Programming error or unexpected exception - log as bug
-            logError(
-              ERROR_IDS.JSONRPC_MESSAGE_HANDLER_ERROR,
-              'Unexpected error while handling JSON-RPC message - possible programming bug',
-              {
-                error: error instanceof Error ? error.message : String(error),
-                errorType: error instanceof Error ? error.constructor.name : typeof error,
-                message: String(message),
-                stack: error instanceof Error ? error.stack : undefined
-              },
-              error instanceof Error ? error : new Error(String(error))
-            );
+      websocketClient.on('message', (message: unknown) => {
+        // A JSON-RPC batch arrives as one array frame (servers may coalesce
+        // streamed notifications); each entry is handled as if sent alone
+        if (Array.isArray(message)) {
+          for (const entry of message) {
+            this.handleIncoming(entry);
           }
+          return;
         }
+        this.handleIncoming(message);
       });
 
       this.messageListenerAttached = true;
@@ -164,6 +134,55 @@ export class JsonRpcHandler {
     }
   }
 
+  /**
+   * Validate and dispatch one parsed JSON-RPC message from the transport
+   */
+  private handleIncoming(message: unknown): void {
+    try {
+      // Message is already parsed by websocketClient. Validate and classify it
+      // in one pass, then dispatch on the result without re-testing fields
+      const kind = this.classifyMessage(message);
+      if (kind === 'response') {
+        this.handleResponse(message as JsonRpcResponse | JsonRpcErrorResponse);
+      } else if (kind === 'notification') {
+        this.handleNotification(message as JsonRpcNotification);
+      } else {
+        logError(
+          ERROR_IDS.JSONRPC_MESSAGE_PARSE_FAILED,
+          'Invalid JSON-RPC message structure - missing required fields',
+          { message: String(message) }
+        );
+      }
+    } catch (error) {
+      const err = error instanceof Error ? error : new Error(String(error));
+
+      // Distinguish between message structure errors and programming bugs
+      // Structure validation errors indicate invalid message properties (TypeError from null/undefined access)
+      if (error instanceof TypeError) {
+        // Invalid message structure - expected in some cases
+        logError(
+          ERROR_IDS.JSONRPC_MESSAGE_PARSE_FAILED,
+          'Invalid JSON-RPC message structure',
+          { error: err.message, message: String(message) },
+          err
+        );
+      } else {
+        // Programming error or unexpected exception - log as bug
+        logError(
+          ERROR_IDS.JSONRPC_MESSAGE_HANDLER_ERROR,
+          'Unexpected error while handling JSON-RPC message - possible programming bug',
+          {
+            error: err.message,
+            errorType: error instanceof Error ? error.constructor.name : typeof error,
+            message: String(message),
+            stack: err === error ? err.stack : undefined
+          },
+          err
+        );
+      }
+    }
+  }
+
   private ensureMessageListenerAttached(): void {
     // Fast path: if already attached, return immediately
     if (this.messageListenerAttached) return;
@@ -194,15 +213,10 @@ export class JsonRpcHandler {
     timeout?: number
   ): Promise<T> {
     const id = this.generateRequestId();
-    const request: JsonRpcRequest = {
-      jsonrpc: '2.0',
-      method,
-      id,
-    };
-
-    if (params) {
-      request.params = params;
-    }
+    // Built in its final shape rather than patched afterwards
+    const request: JsonRpcRequest = params
+      ? { jsonrpc: JSONRPC_VERSION, method, id, params }
+      : { jsonrpc: JSONRPC_VERSION, method, id };
 
     return new Promise<T>((resolve, reject) => {
       const timeoutMs = timeout ?? this.requestTimeout;
@@ -233,29 +247,35 @@ export class JsonRpcHandler {
    * @param params - Optional parameters for the method
    */
   sendNotification(method: string, params?: Record<string, unknown>): void {
-    const notification: JsonRpcNotification = {
-      jsonrpc: '2.0',
-      method,
-      ...(params && { params }),
-    };
+    const notification: JsonRpcNotification = params
+      ? { jsonrpc: JSONRPC_VERSION, method, params }
+      : { jsonrpc: JSONRPC_VERSION, method };
 
     this._sendNotificationMessage(notification, method);
   }
 
   /**
-   * Internal method to send a request message
+   * Internal method to send a request message.
+   * Once the client module is loaded the frame is handed to it synchronously;
+   * only the very first send waits on the dynamic import
    */
-  private async _sendRequestMessage(
+  private _sendRequestMessage(
     request: JsonRpcRequest,
     id: string | number,
     timeoutHandle: NodeJS.Timeout,
     reject: (error: Error) => void
-  ): Promise<void> {
-    try {
-      const websocketClient = await this.getWebSocketClient();
-      const sendSuccess = websocketClient.send(request);
+  ): void {
+    const websocketClient = this.cachedWebSocketClient;
+    if (!websocketClient) {
+      this.getWebSocketClient().then(
+        () => this._sendRequestMessage(request, id, timeoutHandle, reject),
+        (error) => this._failRequest(request, id, timeoutHandle, reject, error)
+      );
+      return;
+    }
 
-      if (!sendSuccess) {
+    try {
+      if (!websocketClient.send(request)) {
         this.pendingRequests.delete(id);
         clearTimeout(timeoutHandle);
         const errorMessage = `Failed to send JSON-RPC request: WebSocket not connected`;
@@ -267,30 +287,47 @@ export class JsonRpcHandler {
         reject(new Error(errorMessage));
       }
     } catch (error) {
-      this.pendingRequests.delete(id);
-      clearTimeout(timeoutHandle);
-      const errorMessage = `Failed to send JSON-RPC request: ${error instanceof Error ? error.message : 'Unknown error'}`;
-      logError(
-        ERROR_IDS.JSONRPC_SEND_REQUEST_FAILED,
-        errorMessage,
-        { error: error instanceof Error ? error.message : String(error), method: request.method }
-      );
-      reject(new Error(errorMessage));
+      this._failRequest(request, id, timeoutHandle, reject, error);
     }
   }
 
+  private _failRequest(
+    request: JsonRpcRequest,
+    id: string | number,
+    timeoutHandle: NodeJS.Timeout,
+    reject: (error: Error) => void,
+    error: unknown
+  ): void {
+    this.pendingRequests.delete(id);
+    clearTimeout(timeoutHandle);
+    const errorMessage = `Failed to send JSON-RPC request: ${error instanceof Error ? error.message : 'Unknown error'}`;
+    logError(
+      ERROR_IDS.JSONRPC_SEND_REQUEST_FAILED,
+      errorMessage,
+      { error: error instanceof Error ? error.message : String(error), method: request.method }
+    );
+    reject(new Error(errorMessage));
+  }
+
   /**
-   * Internal method to send a notification message
+   * Internal method to send a notification message (synchronous once the
+   * client module is loaded, like _sendRequestMessage)
    */
-  private async _sendNotificationMessage(
+  private _sendNotificationMessage(
     notification: JsonRpcNotification,
     method: string
-  ): Promise<void> {
-    try {
-      const websocketClient = await this.getWebSocketClient();
-      const sendSuccess = websocketClient.send(notification);
+  ): void {
+    const websocketClient = this.cachedWebSocketClient;
+    if (!websocketClient) {
+      this.getWebSocketClient().then(
+        () => this._sendNotificationMessage(notification, method),
+        (error) => this._reportNotificationSendError(method, error)
+      );
+      return;
+    }
 
-      if (!sendSuccess) {
+    try {
+      if (!websocketClient.send(notification)) {
         logError(
           ERROR_IDS.JSONRPC_SEND_NOTIFICATION_FAILED,
           `Failed to send notification for method '${method}': WebSocket not connected`,
@@ -298,25 +335,29 @@ export class JsonRpcHandler {
         );
       }
     } catch (error) {
-      logError(
-        ERROR_IDS.JSONRPC_SEND_NOTIFICATION_FAILED,
-        `Failed to send notification for method '${method}'`,
-        { error: error instanceof Error ? error.message : String(error), method }
-      );
+      this._reportNotificationSendError(method, error);
     }
   }
 
+  private _reportNotificationSendError(method: string, error: unknown): void {
+    logError(
+      ERROR_IDS.JSONRPC_SEND_NOTIFICATION_FAILED,
+      `Failed to send notification for method '${method}'`,
+      { error: error instanceof Error ? error.message : String(error), method }
+    );
+  }
+
   /**
    * Register a handler for a specific JSON-RPC notification method
    * @param method - The notification method name (e.g., 'chat.response.chunk')
    * @param handler - Function to handle the notification
    */
   onNotification(method: string, handler: NotificationHandler): () => void {
-    if (!this.notificationHandlers.has(method)) {
-      this.notificationHandlers.set(method, new Set());
+    const existing = this.notificationHandlers.get(method);
+    const handlers = existing ?? new Set<NotificationHandler>();
+    if (!existing) {
+      this.notificationHandlers.set(method, handlers);
     }
-
-    const handlers = this.notificationHandlers.get(method)!;
     handlers.add(handler);
 
     // Return unsubscribe function
@@ -328,20 +369,6 @@ export class JsonRpcHandler {
     };
   }
 
-  /**
-   * Handle incoming JSON-RPC message (response or notification)
-   */
-  private handleMessage(message: JsonRpcMessage): void {
-    // Handle response (has id and result/error, not a method)
-    if ('result' in message || 'error' in message) {
-      this.handleResponse(message as JsonRpcResponse | JsonRpcErrorResponse);
-    }
-    // Handle notification (has method but no id)
-    else if ('method' in message && !('id' in message)) {
-      this.handleNotification(message);
-    }
-  }
-
   /**
    * Handle JSON-RPC response (success or error)
    */
@@ -390,32 +417,30 @@ export class JsonRpcHandler {
       return;
     }
 
-    // Execute handlers - catch both sync and async errors
+    // Execute handlers - sync throws and async rejections are reported the same way
+    const handlerParams = params ?? {};
     handlers.forEach((handler) => {
       try {
-        const result = handler(params ?? {}) as unknown;
+        const result = handler(handlerParams) as unknown;
 
         // If handler returns a promise, catch async errors
         if (result && typeof (result as Promise<unknown>).then === 'function') {
-          (result as Promise<unknown>).catch((error: Error) => {
-            logError(
-              ERROR_IDS.JSONRPC_NOTIFICATION_HANDLER_ERROR,
-              `Error in notification handler for '${method}'`,
-              { error: error instanceof Error ? error.message : String(error), method }
-            );
-          });
+          (result as Promise<unknown>).catch((error) => this.reportNotificationError(method, error));
         }
       } catch (error) {
-        // Catch synchronous errors
-        logError(
-          ERROR_IDS.JSONRPC_NOTIFICATION_HANDLER_ERROR,
-          `Error in notification handler for '${method}'`,
-          { error: error instanceof Error ? error.message : String(error), method }
-        );
+        this.reportNotificationError(method, error);
       }
     });
   }
 
+  private reportNotificationError(method: string, error: unknown): void {
+    logError(
+      ERROR_IDS.JSONRPC_NOTIFICATION_HANDLER_ERROR,
+      `Error in notification handler for '${method}'`,
+      { error: error instanceof Error ? error.message : String(error), method }
+    );
+  }
+
   /**
    * Create an error object from JSON-RPC error response
    */
@@ -435,16 +460,16 @@ export class JsonRpcHandler {
    * Clear all pending requests (e.g., on connection close)
    */
   clearPendingRequests(): void {
-    this.pendingRequests.forEach(({ timeout }) => {
-      clearTimeout(timeout);
-    });
+    // Snapshot and clear before settling so the single pass below never sees
+    // requests issued re-entrantly while it runs
+    const pending = Array.from(this.pendingRequests.values());
+    this.pendingRequests.clear();
 
     const error = new Error('WebSocket connection closed');
-    this.pendingRequests.forEach(({ reject }) => {
+    for (const { timeout, reject } of pending) {
+      clearTimeout(timeout);
       reject(error);
-    });
-
-    this.pendingRequests.clear();
+    }
   }
 
   /**
@@ -464,7 +489,7 @@ export class JsonRpcHandler {
 
     const req = request as Record<string, unknown>;
     return (
-      req.jsonrpc === '2.0' &&
+      req.jsonrpc === JSONRPC_VERSION &&
       typeof req.method === 'string' &&
       (req.id === undefined || typeof req.id === 'string' || typeof req.id === 'number')
     );
@@ -479,7 +504,7 @@ export class JsonRpcHandler {
     }
 
     const resp = response as Record<string, unknown>;
-    if (resp.jsonrpc !== '2.0' || (resp.id === undefined && resp.id !== 0)) {
+    if (resp.jsonrpc !== JSONRPC_VERSION || (resp.id === undefined && resp.id !== 0)) {
       return false;
     }
 
@@ -487,35 +512,27 @@ export class JsonRpcHandler {
   }
 
   /**
-   * Validate if a message is a valid JSON-RPC message structure
+   * Validate a JSON-RPC message structure and report what it is:
+   * 'response' (id and exactly one of result/error), 'notification' (method,
+   * no id), or null when it is neither
    */
-  private isValidJsonRpcMessage(message: unknown): message is JsonRpcMessage {
+  private classifyMessage(message: unknown): 'response' | 'notification' | null {
     if (typeof message !== 'object' || message === null) {
-      return false;
+      return null;
     }
 
     const msg = message as Record<string, unknown>;
-    if (msg.jsonrpc !== '2.0') {
-      return false;
-    }
-
-    // Must be either a response (with id and result/error) or notification (with method, no id)
-    const hasId = 'id' in msg;
-    const hasMethod = 'method' in msg;
-    const hasResult = 'result' in msg;
-    const hasError = 'error' in msg;
-
-    // Response: has id and either result or error (but not both)
-    if (hasId && (hasResult || hasError)) {
-      return (hasResult && !hasError) || (!hasResult && hasError);
+    if (msg.jsonrpc !== JSONRPC_VERSION) {
+      return null;
     }
 
     // Notification: has method but no id
-    if (hasMethod && !hasId) {
-      return true;
+    if (!('id' in msg)) {
+      return 'method' in msg ? 'notification' : null;
     }
 
-    return false;
+    // Response: has id and either result or error (but not both)
+    return ('result' in msg) !== ('error' in msg) ? 'response' : null;
   }
 }
 
@@ -21,6 +21,37 @@ const WS_OPEN = 1;
 const WS_CLOSING = 2;
 const WS_CLOSED = 3;
 
+// Heartbeat frame, encoded once rather than re-serialized every interval
+const PING_MESSAGE: WebSocketSendMessage = { type: 'ping' };
+const PING_FRAME = JSON.stringify(PING_MESSAGE);
+
+// Binary (opcode 0x2) frames arrive as ArrayBuffer and are decoded here exactly
+// once; text frames are already strings and pass through untouched
+const FRAME_DECODER = new TextDecoder('utf-8');
+
+// Frames above this size are dropped before decoding or parsing. Generous enough
+// for full model pushes; anything larger is treated as a misbehaving peer.
+// Units are mixed: text frames are measured in UTF-16 code units and binary
+// frames in bytes, so for non-ASCII text the byte limit is only approximate
+// (measuring exactly would mean encoding the frame first)
+const MAX_FRAME_LENGTH = 16 * 1024 * 1024;
+const CHAR_OPEN_BRACE = 0x7b; // '{'
+const CHAR_OPEN_BRACKET = 0x5b; // '['
+const CHAR_BOM = 0xfeff;
+
+/**
+ * Code unit of the first character JSON.parse would look at: skips leading
+ * JSON whitespace (space, tab, LF, CR). NaN for an all-whitespace frame
+ */
+function firstSignificantCharCode(text: string): number {
+  let i = 0;
+  for (; i < text.length; i++) {
+    const code = text.charCodeAt(i);
+    if (code !== 0x20 && code !== 0x09 && code !== 0x0a && code !== 0x0d) break;
+  }
+  return text.charCodeAt(i);
+}
+
 /**
  * Interface for WebSocket client - implemented by both real WebSocketClient and mocks
  */
@@ -135,6 +166,7 @@ export class WebSocketClient implements WebSocketClientInterface {
       const protocols = this.getAuthProtocols();
 
       this.ws = new WebSocket(this.url, protocols);
+      this.ws.binaryType = 'arraybuffer';
 
       this.ws.onopen = this.handleOpen.bind(this);
       this.ws.onmessage = this.handleMessage.bind(this);
@@ -270,9 +302,16 @@ export class WebSocketClient implements WebSocketClientInterface {
    * @returns true if message was sent, false if connection is not open
    */
   send(message: WebSocketSendMessage): boolean {
+    return this.sendFrame(message, JSON.stringify(message));
+  }
+
+  /**
+   * Send an already-encoded frame; `message` is its source, kept for error context
+   */
+  private sendFrame(message: WebSocketSendMessage, frame: string): boolean {
     if (this.ws && this.ws.readyState === WS_OPEN) {
       try {
-        this.ws.send(JSON.stringify(message));
+        this.ws.send(frame);
         return true;
       } catch (error) {
         logError(
@@ -299,10 +338,12 @@ export class WebSocketClient implements WebSocketClientInterface {
   on<K extends keyof WebSocketEventMap>(event: K, handler: EventHandler<WebSocketEventMap[K]>): void;
   on(event: string, handler: EventHandler<unknown>): void;
   on<K extends keyof WebSocketEventMap>(event: K | string, handler: EventHandler<unknown>): void {
-    if (!this.eventHandlers.has(event as string)) {
-      this.eventHandlers.set(event as string, new Set());
+    let handlers = this.eventHandlers.get(event as string);
+    if (!handlers) {
+      handlers = new Set();
+      this.eventHandlers.set(event as string, handlers);
     }
-    this.eventHandlers.get(event as string)!.add(handler as EventHandler<unknown>);
+    handlers.add(handler as EventHandler<unknown>);
   }
 
   /**
@@ -405,10 +446,42 @@ export class WebSocketClient implements WebSocketClientInterface {
    * Handle incoming WebSocket message
    */
   private handleMessage(event: MessageEvent): void {
+    const raw = event.data as string | ArrayBuffer;
+    const length = typeof raw === 'string' ? raw.length : raw.byteLength;
+    if (length > MAX_FRAME_LENGTH) {
+      logError(
+        ERROR_IDS.WS_MESSAGE_REJECTED,
+        'Dropped oversize WebSocket message',
+        { length, limit: MAX_FRAME_LENGTH }
+      );
+      return;
+    }
+
+    // TextDecoder already strips a UTF-8 BOM from binary frames; JSON.parse
+    // rejects one, so drop it from text frames too
+    let frame = typeof raw === 'string' ? raw : FRAME_DECODER.decode(raw);
+    if (frame.charCodeAt(0) === CHAR_BOM) {
+      frame = frame.slice(1);
+    }
+
+    // Every valid frame is a JSON object or batch array; reject anything else
+    // on its first non-whitespace character instead of attempting a full parse
+    const first = firstSignificantCharCode(frame);
+    if (first !== CHAR_OPEN_BRACE && first !== CHAR_OPEN_BRACKET) {
+      logError(
+        ERROR_IDS.WS_MESSAGE_REJECTED,
+        'Dropped non-JSON WebSocket message',
+        { length }
+      );
+      return;
+    }
+
     try {
-      const message: WebSocketMessage = JSON.parse(event.data);
+      const message: WebSocketMessage = JSON.parse(frame);
       const messageType = message.type ?? 'message';
-      console.log('[WebSocket] Received:', messageType);
+      // Per-frame trace: debug level, since streamed chat chunks arrive one frame
+      // per token and a log-level line each would flood the console
+      console.debug('[WebSocket] Received:', messageType);
 
       // Emit event for this message type
       this.emit(messageType, message);
@@ -540,7 +613,7 @@ export class WebSocketClient implements WebSocketClientInterface {
 
     this.heartbeatTimer = setInterval(() => {
       if (this.ws && this.ws.readyState === WS_OPEN) {
-        this.send({ type: 'ping' });
+        this.sendFrame(PING_MESSAGE, PING_FRAME);
       }
     }, this.heartbeatInterval);
   }
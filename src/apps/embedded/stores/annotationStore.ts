@@ -34,6 +34,29 @@ function handleAnnotationError(
   throw error;
 }
 
+// Per-element grouping of an annotations array, built on first lookup. Every
+// mutation replaces `annotations` with a new array, so a stale index is simply
+// never looked up again and is collected with the array it was built from.
+const byElementCache = new WeakMap<Annotation[], Map<string, readonly Annotation[]>>();
+
+function annotationsByElement(annotations: Annotation[]): Map<string, readonly Annotation[]> {
+  let index = byElementCache.get(annotations);
+  if (!index) {
+    const groups = new Map<string, Annotation[]>();
+    for (const ann of annotations) {
+      const group = groups.get(ann.elementId);
+      if (group) group.push(ann);
+      else groups.set(ann.elementId, [ann]);
+    }
+    index = groups;
+    byElementCache.set(annotations, index);
+  }
+  return index;
+}
+
+// Shared by every element without annotations; frozen so a caller cannot mutate it
+const NO_ANNOTATIONS: readonly Annotation[] = Object.freeze([]);
+
 interface AnnotationStore {
   // State
   annotations: Annotation[];
@@ -62,7 +85,8 @@ interface AnnotationStore {
   createAnnotationReply: (annotationId: string, author: string, content: string) => Promise<void>;
 
   // Computed
-  getAnnotationsForElement: (elementId: string) => Annotation[];
+  /** Cached per-element group; read-only, copy before sorting or mutating */
+  getAnnotationsForElement: (elementId: string) => readonly Annotation[];
   getAnnotationCount: () => number;
   getUnresolvedCount: () => number;
 }
@@ -304,8 +328,7 @@ export const useAnnotationStore = create<AnnotationStore>((set, get) => ({
 
   // Computed getters
   getAnnotationsForElement: (elementId) => {
-    const { annotations } = get();
-    return annotations.filter(ann => ann.elementId === elementId);
+    return annotationsByElement(get().annotations).get(elementId) ?? NO_ANNOTATIONS;
   },
 
   getAnnotationCount: () => {
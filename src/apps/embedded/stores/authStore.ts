@@ -56,19 +56,27 @@ function extractTokenFromStorage(): string | null {
  */
 function getCookieToken(): string | null {
   if (typeof document === 'undefined') return null;
-  const match = document.cookie.split(';').map(part => part.trim()).find(part => part.startsWith(`${STORAGE_KEY}=`));
+  const prefix = `${STORAGE_KEY}=`;
+  const match = document.cookie.split(';').map(part => part.trim()).find(part => part.startsWith(prefix));
   if (!match) return null;
+  // Slice past the name rather than split('='): one allocation, and a value
+  // containing '=' (base64 padding) is kept whole instead of truncated
+  const value = match.slice(prefix.length);
   try {
-    return decodeURIComponent(match.split('=')[1] || '');
+    return decodeURIComponent(value);
   } catch (_err) {
-    return match.split('=')[1] || null;
+    return value || null;
   }
 }
 
+// Initialize with token from localStorage/cookie (AuthRoute populates localStorage).
+// Read once: both initial fields derive from it, and a second read would repeat
+// the storage/cookie lookup and its log line.
+const initialToken = extractTokenFromStorage();
+
 export const useAuthStore = create<AuthState>((set, get) => ({
-  // Initialize with token from localStorage/cookie (AuthRoute populates localStorage)
-  token: extractTokenFromStorage(),
-  isAuthenticated: !!extractTokenFromStorage(),
+  token: initialToken,
+  isAuthenticated: !!initialToken,
 
   setToken: (token: string | null) => {
     // Store/clear in localStorage
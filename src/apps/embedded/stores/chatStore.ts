@@ -57,6 +57,26 @@ export interface ChatStore {
   getCurrentStreamingMessage: () => ChatMessage | undefined;
 }
 
+/**
+ * Index of a message by id, scanning from the newest message. Streaming writes
+ * always target the tail of the history, so this is O(1) on the hot path.
+ */
+function findMessageIndex(messages: ChatMessage[], id: string): number {
+  for (let i = messages.length - 1; i >= 0; i--) {
+    if (messages[i].id === id) return i;
+  }
+  return -1;
+}
+
+/**
+ * Copy of `messages` with the entry at `index` replaced
+ */
+function replaceMessageAt(messages: ChatMessage[], index: number, message: ChatMessage): ChatMessage[] {
+  const next = messages.slice();
+  next[index] = message;
+  return next;
+}
+
 export const useChatStore = create<ChatStore>((set, get) => ({
   // Initial state
   messages: [],
@@ -172,7 +192,8 @@ export const useChatStore = create<ChatStore>((set, get) => ({
     const currentState = get();
 
     // Find message and check existence
-    const message = currentState.messages.find((msg) => msg.id === messageId);
+    const index = findMessageIndex(currentState.messages, messageId);
+    const message = currentState.messages[index];
     if (!message) {
       throw new ChatValidationError(
         'MESSAGE_NOT_FOUND',
@@ -190,20 +211,16 @@ export const useChatStore = create<ChatStore>((set, get) => ({
       );
     }
 
+    // Ensure part has timestamp
+    const partWithTimestamp = {
+      ...part,
+      timestamp: part.timestamp && part.timestamp.length > 0 ? part.timestamp : new Date().toISOString(),
+    };
+
     set((state) => ({
-      messages: state.messages.map((msg) => {
-        if (msg.id === messageId) {
-          // Ensure part has timestamp
-          const partWithTimestamp = {
-            ...part,
-            timestamp: part.timestamp && part.timestamp.length > 0 ? part.timestamp : new Date().toISOString(),
-          };
-          return {
-            ...msg,
-            parts: [...msg.parts, partWithTimestamp],
-          };
-        }
-        return msg;
+      messages: replaceMessageAt(state.messages, index, {
+        ...message,
+        parts: [...message.parts, partWithTimestamp],
       }),
     }));
   },
@@ -225,7 +242,8 @@ export const useChatStore = create<ChatStore>((set, get) => ({
     }
 
     const currentState = get();
-    const message = currentState.messages.find((msg) => msg.id === messageId);
+    const index = findMessageIndex(currentState.messages, messageId);
+    const message = currentState.messages[index];
 
     if (!message) {
       throw new ChatValidationError(
@@ -246,43 +264,35 @@ export const useChatStore = create<ChatStore>((set, get) => ({
       );
     }
 
+    // Build the updated message once by index rather than mapping over the
+    // whole history on every streamed chunk.
+    let parts: ChatContent[];
+    if (isLastPartText) {
+      // If last part is text content, append to it
+      parts = message.parts.slice();
+      parts[parts.length - 1] = {
+        ...(lastPart as TextContent),
+        content: (lastPart as TextContent).content + content,
+      };
+    } else {
+      // Otherwise create new text part
+      const newPart: TextContent = {
+        type: 'text',
+        content,
+        timestamp: new Date().toISOString(),
+      };
+      parts = [...message.parts, newPart];
+    }
+
     set((state) => ({
-      messages: state.messages.map((msg) => {
-        if (msg.id === messageId) {
-          const lastPart = msg.parts[msg.parts.length - 1];
-
-          // If last part is text content, append to it
-          if (lastPart && lastPart.type === 'text') {
-            const updatedParts = [...msg.parts];
-            updatedParts[msg.parts.length - 1] = {
-              ...(lastPart as TextContent),
-              content: (lastPart as TextContent).content + content,
-            };
-            return {
-              ...msg,
-              parts: updatedParts,
-            };
-          }
-
-          // Otherwise create new text part
-          const newPart: TextContent = {
-            type: 'text',
-            content,
-            timestamp: new Date().toISOString(),
-          };
-          return {
-            ...msg,
-            parts: [...msg.parts, newPart],
-          };
-        }
-        return msg;
-      }),
+      messages: replaceMessageAt(state.messages, index, { ...message, parts }),
     }));
   },
 
   /**
    * Update a tool invocation content part by toolUseId
    * Finds and updates the tool invocation with matching unique ID across all messages
+   * (toolUseIds are unique, so only the first match from the newest message is updated)
    */
   updateToolInvocation: (toolUseId, updates) => {
     if (typeof toolUseId !== 'string' || toolUseId.length === 0) {
@@ -294,21 +304,25 @@ export const useChatStore = create<ChatStore>((set, get) => ({
     }
     validateToolInvocationUpdates(updates);
 
+    // Tool invocations are appended to the streaming (newest) message, so scan
+    // newest-first and stop at the first match instead of walking every part of
+    // every message twice.
     const currentState = get();
-    let toolFound = false;
-
-    // Check that tool exists before calling set()
-    for (const msg of currentState.messages) {
-      for (const part of msg.parts) {
+    let messageIndex = -1;
+    let partIndex = -1;
+    for (let i = currentState.messages.length - 1; i >= 0 && messageIndex < 0; i--) {
+      const parts = currentState.messages[i].parts;
+      for (let j = 0; j < parts.length; j++) {
+        const part = parts[j];
         if (part.type === 'tool_invocation' && 'toolUseId' in part && part.toolUseId === toolUseId) {
-          toolFound = true;
+          messageIndex = i;
+          partIndex = j;
           break;
         }
       }
-      if (toolFound) break;
     }
 
-    if (!toolFound) {
+    if (messageIndex < 0) {
       throw new ChatValidationError(
         'TOOL_NOT_FOUND',
         `Tool invocation with toolUseId "${toolUseId}" not found`,
@@ -316,16 +330,12 @@ export const useChatStore = create<ChatStore>((set, get) => ({
       );
     }
 
+    const message = currentState.messages[messageIndex];
+    const parts = message.parts.slice();
+    parts[partIndex] = { ...parts[partIndex], ...updates } as ChatContent;
+
     set((state) => ({
-      messages: state.messages.map((msg) => ({
-        ...msg,
-        parts: msg.parts.map((part) => {
-          if (part.type === 'tool_invocation' && 'toolUseId' in part && part.toolUseId === toolUseId) {
-            return { ...part, ...updates };
-          }
-          return part;
-        })
-      })),
+      messages: replaceMessageAt(state.messages, messageIndex, { ...message, parts }),
     }));
   },
 
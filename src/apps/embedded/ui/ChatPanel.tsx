@@ -17,7 +17,7 @@
  * + the assistant message's error part already capture it).
  */
 
-import { useMemo, useState } from 'react';
+import { useDeferredValue, useMemo, useState } from 'react';
 import {
   ChatContainer,
   ChatMessage,
@@ -118,7 +118,11 @@ export function ChatPanel() {
     return BASE_SUGGESTIONS;
   }, [selectedName, layerName]);
 
-  const rows = useMemo(() => toHeimdallMessages(messages), [messages]);
+  // Streaming lands one store update per `chat.response.chunk`; deferring the
+  // thread lets React coalesce a burst of chunks into a single adapter pass +
+  // markdown render instead of re-rendering the whole thread per token.
+  const deferredMessages = useDeferredValue(messages);
+  const rows = useMemo(() => toHeimdallMessages(deferredMessages), [deferredMessages]);
 
   const [input, setInput] = useState('');
 
@@ -30,6 +30,7 @@ export const ERROR_IDS = {
   WS_MAX_RECONNECT_ATTEMPTS: 'WS_005',
   WS_SEND_FAILED: 'WS_006',
   WS_NOT_CONNECTED: 'WS_007',
+  WS_MESSAGE_REJECTED: 'WS_008',
 
   // Data Loading Errors
   SPEC_CONVERSION_FAILED: 'DATA_001',
@@ -123,9 +123,8 @@ function detectCategory(
     if (ERROR_PATTERNS.networkDetail.timeout.test(errorText)) {
       return ExceptionCategory.TIMEOUT;
     }
-    if (ERROR_PATTERNS.networkDetail.dns.test(errorText)) {
-      return ExceptionCategory.NETWORK_ERROR;
-    }
+    // DNS and other network failures share a category, so no further
+    // sub-pattern needs to run
     return ExceptionCategory.NETWORK_ERROR;
   }
 
@@ -156,10 +155,10 @@ function detectCategory(
     return ExceptionCategory.ASSERTION_FAILED;
   }
 
-  // Validation errors (but exclude state/assertion errors)
+  // Validation errors (but exclude state errors; assertion failures already
+  // returned above, so that pattern is not re-run here)
   if (ERROR_PATTERNS.validation.test(errorText) &&
-      !ERROR_PATTERNS.invalidState.test(errorText) &&
-      !ERROR_PATTERNS.assertionFailed.test(errorText)) {
+      !ERROR_PATTERNS.invalidState.test(errorText)) {
     return ExceptionCategory.VALIDATION_ERROR;
   }
 
@@ -245,46 +244,55 @@ function detectSeverity(
   return ExceptionSeverity.MEDIUM;
 }
 
+// Expected failures (user/environment issues), not bugs
+const EXPECTED_CATEGORIES: ReadonlySet<ExceptionCategory> = new Set([
+  ExceptionCategory.VALIDATION_ERROR,
+  ExceptionCategory.NOT_FOUND,
+  ExceptionCategory.NETWORK_ERROR,
+  ExceptionCategory.TIMEOUT,
+  ExceptionCategory.UNAUTHORIZED,
+  ExceptionCategory.RATE_LIMITED,
+  ExceptionCategory.RESOURCE_EXHAUSTED,
+  ExceptionCategory.CONFLICT,
+  ExceptionCategory.EXTERNAL_SERVICE_ERROR,
+  ExceptionCategory.PARSE_ERROR, // Bad data format from external source
+]);
+
+// Errors that may be transient
+const TRANSIENT_CATEGORIES: ReadonlySet<ExceptionCategory> = new Set([
+  ExceptionCategory.NETWORK_ERROR,
+  ExceptionCategory.TIMEOUT,
+  ExceptionCategory.RATE_LIMITED,
+  ExceptionCategory.EXTERNAL_SERVICE_ERROR, // Service may recover
+]);
+
+// Errors worth retrying
+const RETRYABLE_CATEGORIES: ReadonlySet<ExceptionCategory> = new Set([
+  ExceptionCategory.NETWORK_ERROR,
+  ExceptionCategory.TIMEOUT,
+  ExceptionCategory.RATE_LIMITED,
+  ExceptionCategory.EXTERNAL_SERVICE_ERROR,
+  ExceptionCategory.RESOURCE_EXHAUSTED,
+]);
+
 /**
  * Determine if an exception is an expected failure vs a bug
  */
 function isExpected(category: ExceptionCategory): boolean {
-  // These are expected failures (user/environment issues)
-  const expectedCategories = [
-    ExceptionCategory.VALIDATION_ERROR,
-    ExceptionCategory.NOT_FOUND,
-    ExceptionCategory.NETWORK_ERROR,
-    ExceptionCategory.TIMEOUT,
-    ExceptionCategory.UNAUTHORIZED,
-    ExceptionCategory.RATE_LIMITED,
-    ExceptionCategory.RESOURCE_EXHAUSTED,
-    ExceptionCategory.CONFLICT,
-    ExceptionCategory.EXTERNAL_SERVICE_ERROR,
-    ExceptionCategory.PARSE_ERROR, // Bad data format from external source
-  ];
-
-  return expectedCategories.includes(category);
+  return EXPECTED_CATEGORIES.has(category);
 }
 
 /**
  * Determine if an error is transient (may recover with retry)
  */
 function isTransientError(category: ExceptionCategory, errorText: string): boolean {
-  // These errors may be transient
-  const transientCategories = [
-    ExceptionCategory.NETWORK_ERROR,
-    ExceptionCategory.TIMEOUT,
-    ExceptionCategory.RATE_LIMITED,
-    ExceptionCategory.EXTERNAL_SERVICE_ERROR, // Service may recover
-  ];
-
   // Check if error indicates resource exhaustion (possibly transient)
   if (category === ExceptionCategory.RESOURCE_EXHAUSTED) {
     // Only transient if it looks like a temporary spike
     return !errorText.includes('permanent') && !errorText.includes('quota');
   }
 
-  return transientCategories.includes(category);
+  return TRANSIENT_CATEGORIES.has(category);
 }
 
 /**
@@ -351,15 +359,7 @@ function determineRecoveryStrategy(
  * Determine if an error should be retried
  */
 function isRetryable(category: ExceptionCategory): boolean {
-  const retryableCategories = [
-    ExceptionCategory.NETWORK_ERROR,
-    ExceptionCategory.TIMEOUT,
-    ExceptionCategory.RATE_LIMITED,
-    ExceptionCategory.EXTERNAL_SERVICE_ERROR,
-    ExceptionCategory.RESOURCE_EXHAUSTED,
-  ];
-
-  return retryableCategories.includes(category);
+  return RETRYABLE_CATEGORIES.has(category);
 }
 
 /**
@@ -1,7 +1,8 @@
 /**
  * Auto-generated API Client with React Query Hooks
- * Generated from: /Users/austinsand/workspace/documentation_robotics_viewer/docs/api-spec.yaml
+ * Generated from: docs/api-spec.yaml
  * API Version: 0.1.0
+ * Source hash: d3c064badaf1cd89050113028a8931621857b71f604fdea2be792a88878926a1
  *
  * IMPORTANT: This file is auto-generated. Do not edit directly.
  * Regenerate with: npm run client:generate
@@ -335,3 +335,85 @@ describe('chatService — sendMessage success path', () => {
     expect(assistant.isStreaming).toBe(false);
   });
 });
+
+describe('chatService — getStatus request sharing', () => {
+  /** Outbound `chat.status` request frames seen so far. */
+  function statusRequests(): Array<{ id: string | number }> {
+    return socket.sent.filter(
+      (f): f is { id: string | number; method: string } =>
+        typeof f === 'object' && f !== null && (f as { method?: string }).method === 'chat.status',
+    );
+  }
+
+  it('shares one chat.status request between concurrent callers', async () => {
+    const first = chatService.getStatus();
+    const second = chatService.getStatus();
+    await flush();
+
+    expect(statusRequests()).toHaveLength(1);
+    socket.simulateMessage({
+      jsonrpc: '2.0',
+      result: { sdk_available: true, sdk_version: '1.2.3' },
+      id: statusRequests()[0]!.id,
+    });
+
+    const expected = { sdkAvailable: true, sdkVersion: '1.2.3', errorMessage: null };
+    await expect(first).resolves.toEqual(expected);
+    await expect(second).resolves.toEqual(expected);
+    expect(useChatStore.getState().sdkStatus).toEqual(expected);
+  });
+
+  it('issues a new request once the previous one has settled', async () => {
+    const first = chatService.getStatus();
+    await flush();
+    socket.simulateMessage({ jsonrpc: '2.0', result: { sdkAvailable: true }, id: statusRequests()[0]!.id });
+    await first;
+
+    const second = chatService.getStatus();
+    await flush();
+
+    const requests = statusRequests();
+    expect(requests).toHaveLength(2);
+    expect(requests[1]!.id).not.toBe(requests[0]!.id);
+    socket.simulateMessage({ jsonrpc: '2.0', result: { sdkAvailable: false }, id: requests[1]!.id });
+    await expect(second).resolves.toMatchObject({ sdkAvailable: false });
+  });
+
+  it('delivers a rejection to every concurrent caller', async () => {
+    const first = chatService.getStatus();
+    const second = chatService.getStatus();
+    await flush();
+
+    expect(statusRequests()).toHaveLength(1);
+    socket.simulateMessage({
+      jsonrpc: '2.0',
+      error: { code: -32001, message: 'SDK unavailable' },
+      id: statusRequests()[0]!.id,
+    });
+
+    const [a, b] = await Promise.allSettled([first, second]);
+    expect(a.status).toBe('rejected');
+    expect(b.status).toBe('rejected');
+    expect((a as PromiseRejectedResult).reason).toBe((b as PromiseRejectedResult).reason);
+    expect(useChatStore.getState().sdkStatus).toMatchObject({ sdkAvailable: false });
+  });
+
+  it('drops the shared request on reset() so the next call asks again', async () => {
+    const abandoned = chatService.getStatus();
+    await flush();
+
+    chatService.reset();
+    const fresh = chatService.getStatus();
+    await flush();
+
+    const requests = statusRequests();
+    expect(requests).toHaveLength(2);
+
+    // Settle both so nothing is left pending on the shared handler
+    for (const { id } of requests) {
+      socket.simulateMessage({ jsonrpc: '2.0', result: { sdkAvailable: true }, id });
+    }
+    await expect(fresh).resolves.toMatchObject({ sdkAvailable: true });
+    await abandoned;
+  });
+});
@@ -77,6 +77,18 @@ describe('useSpec — maps the /api/spec fixture', () => {
     // raw payload is passed through for the Schema-view transforms.
     expect(result.current.raw?.schemas).toBeTruthy();
   });
+
+  it('shares one derived result across consumers of the same payload', async () => {
+    const client = createTestQueryClient();
+    const first = renderHookWithClient(() => useSpec(), { client });
+    const second = renderHookWithClient(() => useSpec(), { client });
+
+    await waitFor(() => expect(first.result.current.isSuccess).toBe(true));
+    await waitFor(() => expect(second.result.current.isSuccess).toBe(true));
+
+    expect(second.result.current.raw).toBe(first.result.current.raw);
+    expect(second.result.current.derived).toBe(first.result.current.derived);
+  });
 });
 
 describe('useChangesets — maps the /api/changesets fixture', () => {
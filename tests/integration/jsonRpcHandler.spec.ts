@@ -126,6 +126,20 @@ describe('jsonRpcHandler — sendRequest correlation', () => {
     ).not.toThrow();
     expect(handler.getPendingRequestCount()).toBe(0);
   });
+
+  it('hands the frame to the socket synchronously once the client is loaded', async () => {
+    const handler = await makeHandler();
+    const before = socket.sent.length;
+
+    const promise = handler.sendRequest('demo.method');
+    handler.sendNotification('demo.notify');
+
+    // No flush: the import already resolved while attaching the listener
+    expect(socket.sent.length).toBe(before + 2);
+    const { id } = socket.sent[before] as { id: string | number };
+    socket.simulateMessage({ jsonrpc: '2.0', result: { ok: true }, id });
+    await expect(promise).resolves.toEqual({ ok: true });
+  });
 });
 
 describe('jsonRpcHandler — onNotification dispatch', () => {
@@ -159,6 +173,19 @@ describe('jsonRpcHandler — onNotification dispatch', () => {
     socket.simulateMessage({ jsonrpc: '2.0', method: 'chat.usage', params: { t: 2 } });
     expect(cb).toHaveBeenCalledTimes(1); // still 1 — unsubscribed
   });
+
+  it('dispatches every entry of a batched (array) frame in order', async () => {
+    const handler = await makeHandler();
+    const cb = vi.fn();
+    handler.onNotification('chat.response.chunk', cb);
+
+    socket.simulateMessage([
+      { jsonrpc: '2.0', method: 'chat.response.chunk', params: { content: 'a' } },
+      { jsonrpc: '2.0', method: 'chat.response.chunk', params: { content: 'b' } },
+    ]);
+
+    expect(cb.mock.calls).toEqual([[{ content: 'a' }], [{ content: 'b' }]]);
+  });
 });
 
 describe('jsonRpcHandler — timeout', () => {
@@ -102,6 +102,47 @@ describe('websocketClient — typed app frames', () => {
   });
 });
 
+describe('websocketClient — binary frames', () => {
+  it('requests ArrayBuffer delivery and decodes a binary frame like a text frame', () => {
+    const { client, socket } = connectOpenClient();
+    const messageListener = vi.fn();
+    client.on('message', messageListener);
+
+    expect((socket as unknown as { binaryType?: string }).binaryType).toBe('arraybuffer');
+
+    const bytes = new TextEncoder().encode(JSON.stringify({ jsonrpc: '2.0', result: { ok: 'é' }, id: 'b' }));
+    socket.onmessage?.({ data: bytes.buffer } as MessageEvent);
+
+    expect(messageListener).toHaveBeenCalledTimes(1);
+    expect(messageListener).toHaveBeenCalledWith({ jsonrpc: '2.0', result: { ok: 'é' }, id: 'b' });
+  });
+
+  it('drops a frame that cannot be JSON (wrong first character) without dispatching', () => {
+    const { client, socket } = connectOpenClient();
+    const messageListener = vi.fn();
+    client.on('message', messageListener);
+
+    socket.simulateMessage('<html>502 Bad Gateway</html>');
+    socket.simulateMessage('');
+
+    expect(messageListener).not.toHaveBeenCalled();
+  });
+
+  it('accepts frames with leading JSON whitespace or a byte-order mark', () => {
+    const { client, socket } = connectOpenClient();
+    const messageListener = vi.fn();
+    client.on('message', messageListener);
+
+    socket.simulateMessage(' \n\t{"jsonrpc":"2.0","result":{},"id":"ws"}');
+    socket.simulateMessage('\uFEFF{"jsonrpc":"2.0","result":{},"id":"bom"}');
+    socket.simulateMessage('\r\n[{"jsonrpc":"2.0","result":{},"id":"batch"}]');
+
+    expect(messageListener).toHaveBeenCalledTimes(3);
+    expect(messageListener).toHaveBeenNthCalledWith(1, { jsonrpc: '2.0', result: {}, id: 'ws' });
+    expect(messageListener).toHaveBeenNthCalledWith(2, { jsonrpc: '2.0', result: {}, id: 'bom' });
+  });
+});
+
 describe('websocketClient — reconnect / backoff', () => {
   it('schedules a reconnect with exponential backoff on an unexpected close', () => {
     vi.useFakeTimers();
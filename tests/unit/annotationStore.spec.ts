@@ -0,0 +1,63 @@
+// @vitest-environment happy-dom
+import { describe, it, expect, beforeEach } from 'vitest';
+import { useAnnotationStore } from '@/apps/embedded/stores/annotationStore';
+import type { Annotation } from '@/apps/embedded/types/annotations';
+
+function annotation(id: string, elementId: string): Annotation {
+  return {
+    id,
+    elementId,
+    author: 'tester',
+    content: `note ${id}`,
+    createdAt: '2024-01-01T00:00:00.000Z',
+    resolved: false,
+  };
+}
+
+const get = () => useAnnotationStore.getState();
+
+beforeEach(() => {
+  get().reset();
+});
+
+describe('getAnnotationsForElement', () => {
+  it('groups annotations by element in store order', () => {
+    get().setAnnotations([
+      annotation('a1', 'el-1'),
+      annotation('a2', 'el-2'),
+      annotation('a3', 'el-1'),
+    ]);
+
+    expect(get().getAnnotationsForElement('el-1').map((a) => a.id)).toEqual(['a1', 'a3']);
+    expect(get().getAnnotationsForElement('el-2').map((a) => a.id)).toEqual(['a2']);
+  });
+
+  it('returns the same group for repeated lookups against the same array', () => {
+    get().setAnnotations([annotation('a1', 'el-1')]);
+
+    expect(get().getAnnotationsForElement('el-1')).toBe(get().getAnnotationsForElement('el-1'));
+  });
+
+  it('returns a frozen empty result for an element without annotations', () => {
+    get().setAnnotations([annotation('a1', 'el-1')]);
+
+    const none = get().getAnnotationsForElement('missing');
+    expect(none).toEqual([]);
+    expect(Object.isFrozen(none)).toBe(true);
+  });
+
+  it('reflects a replaced annotations array instead of the stale grouping', () => {
+    get().setAnnotations([annotation('a1', 'el-1')]);
+    const before = get().getAnnotationsForElement('el-1');
+
+    get().addAnnotation(annotation('a2', 'el-1'));
+    const after = get().getAnnotationsForElement('el-1');
+
+    expect(after).not.toBe(before);
+    expect(after.map((a) => a.id)).toEqual(['a1', 'a2']);
+    expect(before.map((a) => a.id)).toEqual(['a1']);
+
+    get().removeAnnotation('a1');
+    expect(get().getAnnotationsForElement('el-1').map((a) => a.id)).toEqual(['a2']);
+  });
+});
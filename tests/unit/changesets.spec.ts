@@ -27,12 +27,14 @@ describe('normalizeOp', () => {
     ['relationship-add', 'add'], // folded into add
     ['delete', 'delete'],
     ['remove', 'delete'],
+    ['del', 'delete'],
     ['relationship-delete', 'delete'], // folded into delete
     ['update', 'update'],
     ['modify', 'update'], // anything else → update
     [undefined, 'update'],
     ['', 'update'],
     ['ADD', 'add'], // case-insensitive
+    ['constructor', 'update'], // alias lookup ignores prototype keys
   ];
 
   it.each(cases)('normalizeOp(%j) === %j', (type, expected) => {
@@ -0,0 +1,118 @@
+// @vitest-environment happy-dom
+import { describe, it, expect, beforeEach } from 'vitest';
+import { useChatStore } from '@/apps/embedded/stores/chatStore';
+import type { ChatContent, ChatMessage, ToolInvocationContent } from '@/apps/embedded/types/chat';
+
+const TS = '2024-01-01T00:00:00.000Z';
+
+function message(id: string, parts: ChatContent[] = []): ChatMessage {
+  return { id, role: 'assistant', conversationId: 'conv-1', timestamp: TS, parts };
+}
+
+function toolPart(toolUseId: string, toolName = 'search'): ToolInvocationContent {
+  return {
+    type: 'tool_invocation',
+    toolUseId,
+    toolName,
+    toolInput: {},
+    status: { state: 'executing' },
+    timestamp: TS,
+  };
+}
+
+const get = () => useChatStore.getState();
+
+beforeEach(() => {
+  get().reset();
+});
+
+describe('appendPart', () => {
+  it('appends to the target message and leaves other messages untouched', () => {
+    get().addMessage(message('m1'));
+    get().addMessage(message('m2'));
+    const [m1Before] = get().messages;
+
+    get().appendPart('m2', toolPart('tool-1'));
+
+    const [m1, m2] = get().messages;
+    expect(m2.parts).toHaveLength(1);
+    expect(m2.parts[0]).toMatchObject({ type: 'tool_invocation', toolUseId: 'tool-1' });
+    expect(m1).toBe(m1Before);
+  });
+
+  it('fills in a timestamp when the part has none', () => {
+    get().addMessage(message('m1'));
+
+    get().appendPart('m1', { type: 'text', content: 'hi', timestamp: '' });
+
+    expect(get().messages[0].parts[0].timestamp).not.toBe('');
+  });
+});
+
+describe('appendTextContent', () => {
+  it('coalesces into a trailing text part and starts a new one after other parts', () => {
+    get().addMessage(message('m1'));
+
+    get().appendTextContent('m1', 'Hello');
+    get().appendTextContent('m1', ', world');
+    get().appendPart('m1', toolPart('tool-1'));
+    get().appendTextContent('m1', 'Done');
+
+    const parts = get().messages[0].parts;
+    expect(parts.map((p) => p.type)).toEqual(['text', 'tool_invocation', 'text']);
+    expect(parts[0]).toMatchObject({ content: 'Hello, world' });
+    expect(parts[2]).toMatchObject({ content: 'Done' });
+  });
+
+  it('replaces only the target message and does not mutate the previous part', () => {
+    get().addMessage(message('m1'));
+    get().addMessage(message('m2'));
+    get().appendTextContent('m2', 'a');
+    const [m1Before, m2Before] = get().messages;
+    const partBefore = m2Before.parts[0];
+
+    get().appendTextContent('m2', 'b');
+
+    const [m1, m2] = get().messages;
+    expect(m1).toBe(m1Before);
+    expect(m2).not.toBe(m2Before);
+    expect(m2.parts[0]).toMatchObject({ content: 'ab' });
+    expect(partBefore).toMatchObject({ content: 'a' });
+  });
+});
+
+describe('updateToolInvocation', () => {
+  it('updates the matching tool part and keeps untouched messages and parts by identity', () => {
+    get().addMessage(message('m1', [toolPart('tool-old')]));
+    get().addMessage(message('m2', [{ type: 'text', content: 'x', timestamp: TS }, toolPart('tool-1')]));
+    const [m1Before, m2Before] = get().messages;
+
+    get().updateToolInvocation('tool-1', { status: { state: 'completed', result: 42 } });
+
+    const [m1, m2] = get().messages;
+    expect(m1).toBe(m1Before);
+    expect(m2.parts[0]).toBe(m2Before.parts[0]);
+    expect(m2.parts[1]).toMatchObject({ toolUseId: 'tool-1', status: { state: 'completed', result: 42 } });
+  });
+
+  it('updates only the newest match when a toolUseId repeats', () => {
+    get().addMessage(message('m1', [toolPart('tool-dup')]));
+    get().addMessage(message('m2', [toolPart('tool-dup')]));
+    const [m1Before] = get().messages;
+
+    get().updateToolInvocation('tool-dup', { status: { state: 'failed', error: 'boom' } });
+
+    const [m1, m2] = get().messages;
+    expect(m1).toBe(m1Before);
+    expect(m1.parts[0]).toMatchObject({ status: { state: 'executing' } });
+    expect(m2.parts[0]).toMatchObject({ status: { state: 'failed', error: 'boom' } });
+  });
+
+  it('throws TOOL_NOT_FOUND when no part matches', () => {
+    get().addMessage(message('m1', [toolPart('tool-1')]));
+
+    expect(() => get().updateToolInvocation('missing', { status: { state: 'executing' } })).toThrow(
+      /not found/,
+    );
+  });
+});
@@ -143,6 +143,11 @@ describe('buildModelIndex (445-link resolution regression)', () => {
     expect(index.byEndpoint.size).toBe(model.nodes.length * 2);
   });
 
+  it('returns the same index for the same derived model', () => {
+    expect(buildModelIndex(model)).toBe(buildModelIndex(model));
+    expect(buildModelIndex({ ...model })).not.toBe(buildModelIndex(model));
+  });
+
   it('resolves ALL 445 link endpoints — zero unresolved', () => {
     const index = buildModelIndex(model);
     const unresolved = model.links.filter(
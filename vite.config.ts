@@ -2,7 +2,7 @@ import { defineConfig } from 'vite';
 import react from '@vitejs/plugin-react';
 import flowbiteReact from 'flowbite-react/plugin/vite';
 import path from 'path';
-import { copyFileSync, mkdirSync, readdirSync } from 'fs';
+import { copyFileSync, existsSync, mkdirSync, readdirSync, readFileSync, statSync } from 'fs';
 
 /**
  * Custom Vite plugin to copy .dr/spec files
@@ -10,30 +10,43 @@ import { copyFileSync, mkdirSync, readdirSync } from 'fs';
  * - For development: serves from source .dr/spec/ directory via middleware
  */
 function copySpecFilesPlugin() {
+  // Resolved once; the middleware only joins the request path onto it
+  const specSrcDir = path.resolve(__dirname, '.dr/spec');
+  const specDirPrefix = specSrcDir + path.sep;
+
   return {
     name: 'copy-spec-files',
     configureServer(server: any) {
       // Add middleware to serve .dr/spec files in development
       return () => {
         server.middlewares.use('/.dr/spec', (req: any, res: any, next: any) => {
-          const specPath = path.resolve(__dirname, '.dr/spec', req.url || '');
+          // req.url is relative to the mount point ('/api.json?t=...'). join()
+          // rather than resolve(), which would treat the leading '/' as the root
+          const pathname = (req.url || '/').replace(/\?.*$/, '');
+          const normalizedSpecPath = path.join(specSrcDir, pathname);
 
           // Security: ensure the path is within .dr/spec
-          const normalizedSpecPath = path.normalize(specPath);
-          const expectedDirPath = path.normalize(path.resolve(__dirname, '.dr/spec'));
-
-          if (!normalizedSpecPath.startsWith(expectedDirPath)) {
+          if (!normalizedSpecPath.startsWith(specDirPrefix)) {
             res.statusCode = 403;
             res.end('Forbidden');
             return;
           }
 
           try {
-            const { readFileSync, existsSync } = require('fs');
-            if (existsSync(normalizedSpecPath) && normalizedSpecPath.endsWith('.json')) {
-              const content = readFileSync(normalizedSpecPath, 'utf-8');
+            if (normalizedSpecPath.endsWith('.json') && existsSync(normalizedSpecPath)) {
+              // Weak validator from size + mtime so the browser revalidates with a
+              // 304 instead of re-reading and re-downloading an unchanged spec file
+              const stats = statSync(normalizedSpecPath);
+              const etag = `W/"${stats.size.toString(16)}-${Math.floor(stats.mtimeMs).toString(16)}"`;
+              res.setHeader('ETag', etag);
+              res.setHeader('Cache-Control', 'no-cache');
+              if (req.headers?.['if-none-match'] === etag) {
+                res.statusCode = 304;
+                res.end();
+                return;
+              }
               res.setHeader('Content-Type', 'application/json');
-              res.end(content);
+              res.end(readFileSync(normalizedSpecPath));
               return;
             }
           } catch (error) {
@@ -46,25 +59,23 @@ function copySpecFilesPlugin() {
     },
     writeBundle() {
       try {
-        const specSrcDir = path.resolve(__dirname, '.dr/spec');
         const specDestDir = path.resolve(__dirname, 'dist/.dr/spec');
 
         // Create destination directory if it doesn't exist
         mkdirSync(specDestDir, { recursive: true });
 
-        // Copy all .json files from .dr/spec to dist/.dr/spec
-        const files = readdirSync(specSrcDir);
-        const copiedFiles = [];
-        for (const file of files) {
-          if (file.endsWith('.json')) {
-            const src = path.join(specSrcDir, file);
-            const dest = path.join(specDestDir, file);
-            copyFileSync(src, dest);
-            copiedFiles.push(file);
+        // Copy all .json files from .dr/spec to dist/.dr/spec. Dirents carry the
+        // entry type from the directory read itself, so no per-file stat is needed
+        // to skip anything that isn't a regular file
+        let copiedCount = 0;
+        for (const entry of readdirSync(specSrcDir, { withFileTypes: true })) {
+          if (entry.isFile() && entry.name.endsWith('.json')) {
+            copyFileSync(path.join(specSrcDir, entry.name), path.join(specDestDir, entry.name));
+            copiedCount++;
           }
         }
 
-        console.log(`Copied ${copiedFiles.length} spec files to dist/.dr/spec/`);
+        console.log(`Copied ${copiedCount} spec files to dist/.dr/spec/`);
       } catch (error) {
         console.warn('Failed to copy spec files:', error);
       }